@@ -2,10 +2,12 @@
 
 __version__ = "0.1.0"
 
+from test_coordinator_data_adapter.batch_loader import BatchLoader
 from test_coordinator_data_adapter.config import AdapterConfig
 from test_coordinator_data_adapter.factory import AdapterFactory
 
 __all__ = [
     "AdapterConfig",
     "AdapterFactory",
+    "BatchLoader",
 ]
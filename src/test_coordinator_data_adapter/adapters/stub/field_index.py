@@ -0,0 +1,90 @@
+"""Secondary index helper for stub repositories."""
+from collections.abc import Hashable, Iterable, KeysView
+from typing import Generic, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+
+_NO_IDS: dict[str, None] = {}
+
+
+class FieldIndex(Generic[K]):
+    """Maps field values to the IDs of entities holding them.
+
+    IDs are kept in insertion order per value. The values each entity was
+    indexed under are remembered, so re-indexing an entity after its fields
+    change (including in-place mutation of the stored model) moves it to the
+    right buckets without needing the old model.
+    """
+
+    def __init__(self) -> None:
+        self._ids_by_key: dict[K, dict[str, None]] = {}
+        self._keys_by_id: dict[str, tuple[K, ...]] = {}
+
+    def index(self, entity_id: str, *keys: K) -> None:
+        """Index entity under keys, replacing any keys it was indexed under."""
+        previous = self._keys_by_id.get(entity_id)
+        if previous == keys:
+            return
+        if previous is not None:
+            self._unlink(entity_id, previous)
+        ids_by_key = self._ids_by_key
+        for key in keys:
+            bucket = ids_by_key.get(key)
+            if bucket is None:
+                ids_by_key[key] = {entity_id: None}
+            else:
+                bucket[entity_id] = None
+        self._keys_by_id[entity_id] = keys
+
+    def index_many(self, entries: Iterable[tuple[str, tuple[K, ...]]]) -> None:
+        """Index several (entity_id, keys) pairs, updating each bucket once.
+
+        Equivalent to calling index for each pair in order when entity IDs are
+        distinct; for a repeated ID the last pair wins.
+        """
+        keys_by_id = self._keys_by_id
+        added: dict[K, list[str]] = {}
+        for entity_id, keys in dict(entries).items():
+            previous = keys_by_id.get(entity_id)
+            if previous == keys:
+                continue
+            if previous is not None:
+                self._unlink(entity_id, previous)
+            for key in keys:
+                ids = added.get(key)
+                if ids is None:
+                    added[key] = [entity_id]
+                else:
+                    ids.append(entity_id)
+            keys_by_id[entity_id] = keys
+        ids_by_key = self._ids_by_key
+        for key, ids in added.items():
+            bucket = ids_by_key.get(key)
+            if bucket is None:
+                ids_by_key[key] = dict.fromkeys(ids)
+            else:
+                bucket.update(dict.fromkeys(ids))
+
+    def remove(self, entity_id: str) -> None:
+        """Remove entity from the index."""
+        keys = self._keys_by_id.pop(entity_id, None)
+        if keys is not None:
+            self._unlink(entity_id, keys)
+
+    def ids(self, key: K) -> KeysView[str]:
+        """Get IDs of entities indexed under key."""
+        return self._ids_by_key.get(key, _NO_IDS).keys()
+
+    def count(self, key: K) -> int:
+        """Count entities indexed under key."""
+        return len(self._ids_by_key.get(key, _NO_IDS))
+
+    def _unlink(self, entity_id: str, keys: tuple[K, ...]) -> None:
+        """Drop entity from the buckets for keys, discarding emptied buckets."""
+        ids_by_key = self._ids_by_key
+        for key in keys:
+            bucket = ids_by_key.get(key)
+            if bucket is not None:
+                bucket.pop(entity_id, None)
+                if not bucket:
+                    del ids_by_key[key]
@@ -1,159 +1,320 @@
 """Stub cache repository implementation."""
+import functools
+import itertools
+import re
+import time
 import structlog
 import orjson
-from datetime import datetime, UTC, timedelta
-from typing import Any, Dict, List, Optional
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional
 
 from test_coordinator_data_adapter.interfaces import CacheRepository
+from test_coordinator_data_adapter.logging_utils import is_debug_enabled
 
 logger = structlog.get_logger(__name__)
 
+# Number of writes between full sweeps of expired entries; reads expire lazily.
+_SWEEP_INTERVAL = 10_000
+
+# Maximum number of released entries kept for reuse per repository.
+_ENTRY_POOL_SIZE = 4096
+
+# Default entry cap; beyond it the least recently used entries are evicted.
+_DEFAULT_MAX_SIZE = 1_000_000
+
+
+def _glob_class_to_regex(pattern: str, i: int) -> tuple[str, int]:
+    """Translate the Redis glob character class starting after ``[`` at i.
+
+    Returns the regex for the class and the index just past its closing ``]``;
+    an unterminated class runs to the end of the pattern, as in Redis.
+    """
+    n = len(pattern)
+    negate = i < n and pattern[i] == "^"
+    if negate:
+        i += 1
+    members = []
+    while i < n and pattern[i] != "]":
+        if pattern[i] == "\\" and i + 1 < n:
+            i += 1
+            members.append(re.escape(pattern[i]))
+        elif i + 2 < n and pattern[i + 1] == "-":
+            low, high = sorted((pattern[i], pattern[i + 2]))
+            members.append(f"{re.escape(low)}-{re.escape(high)}")
+            i += 2
+        else:
+            members.append(re.escape(pattern[i]))
+        i += 1
+    if not members:
+        regex = "." if negate else "(?!)"
+    else:
+        regex = f"[{'^' if negate else ''}{''.join(members)}]"
+    return regex, i + 1
+
+
+@functools.lru_cache(maxsize=256)
+def _glob_to_regex(pattern: str) -> re.Pattern[str]:
+    """Compile a Redis glob pattern to an anchored regex.
+
+    Follows Redis KEYS matching: ``*`` and ``?`` wildcards, ``[...]`` classes
+    with ``^`` negation and ``a-z`` ranges, and ``\\`` escaping the next character.
+    """
+    parts = []
+    i, n = 0, len(pattern)
+    while i < n:
+        char = pattern[i]
+        i += 1
+        if char == "*":
+            parts.append(".*")
+        elif char == "?":
+            parts.append(".")
+        elif char == "[":
+            regex, i = _glob_class_to_regex(pattern, i)
+            parts.append(regex)
+        elif char == "\\" and i < n:
+            parts.append(re.escape(pattern[i]))
+            i += 1
+        else:
+            parts.append(re.escape(char))
+    return re.compile(f"(?s:{''.join(parts)})\\Z")
+
 
 class CacheEntry:
-    """Cache entry with value and expiration."""
+    """Cache entry with value and expiration.
 
-    def __init__(self, value: Any, ttl: Optional[int] = None):
-        self.value = value
-        self.created_at = datetime.now(UTC)
-        self.expires_at = (
-            self.created_at + timedelta(seconds=ttl) if ttl is not None else None
-        )
+    Expiration is stored as a deadline on the repository's monotonic clock, so
+    expiry checks are plain float comparisons and are unaffected by wall-clock
+    adjustments.
+    """
 
-    def is_expired(self) -> bool:
-        """Check if entry is expired."""
-        if self.expires_at is None:
-            return False
-        return datetime.now(UTC) > self.expires_at
+    __slots__ = ("value", "expires_at")
+
+    def __init__(self, value: Any, expires_at: Optional[float] = None):
+        self.value = value
+        self.expires_at = expires_at
 
-    def get_ttl(self) -> Optional[int]:
-        """Get remaining TTL in seconds."""
+    def get_ttl(self, now: float) -> Optional[int]:
+        """Get remaining TTL in seconds at now, on the repository's clock."""
         if self.expires_at is None:
             return None
-        remaining = (self.expires_at - datetime.now(UTC)).total_seconds()
-        return max(0, int(remaining))
+        return max(0, int(self.expires_at - now))
 
 
 class StubCacheRepository(CacheRepository):
-    """In-memory stub implementation of cache repository."""
+    """In-memory stub implementation of cache repository.
 
-    def __init__(self):
-        self._cache: dict[str, CacheEntry] = {}
+    Holds at most max_size entries, evicting the least recently used ones
+    when a write overflows it, like Redis with an allkeys-lru policy. TTLs are
+    measured with time_func, a monotonic clock in seconds.
+    """
+
+    def __init__(
+        self,
+        max_size: int = _DEFAULT_MAX_SIZE,
+        time_func: Callable[[], float] = time.monotonic,
+    ):
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+        self._cache: OrderedDict[str, CacheEntry] = OrderedDict()
+        self._max_size = max_size
+        self._time = time_func
+        self._writes_since_sweep = 0
+        self._free_entries: list[CacheEntry] = []
+        self._debug_enabled = is_debug_enabled(logger)
         logger.info("stub_cache_repository_initialized", storage="in-memory")
 
     def _clean_expired(self):
         """Remove expired entries."""
-        expired_keys = [k for k, v in self._cache.items() if v.is_expired()]
-        for key in expired_keys:
+        now = self._time()
+        cache = self._cache
+        for key in [
+            k for k, v in cache.items() if v.expires_at is not None and v.expires_at < now
+        ]:
+            self._release(cache.pop(key))
+        self._writes_since_sweep = 0
+
+    def _deadline(self, ttl: Optional[int]) -> Optional[float]:
+        """Convert a TTL in seconds to an expiry deadline."""
+        return self._time() + ttl if ttl is not None else None
+
+    def _new_entry(self, value: Any, expires_at: Optional[float]) -> CacheEntry:
+        """Get an entry from the free list, allocating one if it is empty."""
+        if self._free_entries:
+            entry = self._free_entries.pop()
+            entry.value = value
+            entry.expires_at = expires_at
+            return entry
+        return CacheEntry(value, expires_at)
+
+    def _release(self, entry: CacheEntry):
+        """Return a removed entry to the free list."""
+        if len(self._free_entries) < _ENTRY_POOL_SIZE:
+            entry.value = None
+            self._free_entries.append(entry)
+
+    def _store(self, key: str, value: Any, expires_at: Optional[float]):
+        """Store value under key, reusing the key's existing entry if present."""
+        entry = self._cache.get(key)
+        if entry is None:
+            self._cache[key] = self._new_entry(value, expires_at)
+        else:
+            entry.value = value
+            entry.expires_at = expires_at
+            self._cache.move_to_end(key)
+
+    def _get_entry(self, key: str) -> Optional[CacheEntry]:
+        """Get live entry for key and mark it recently used, evicting it if expired."""
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+        if entry.expires_at is not None and entry.expires_at < self._time():
             del self._cache[key]
+            self._release(entry)
+            return None
+        self._cache.move_to_end(key)
+        return entry
+
+    def _record_writes(self, count: int = 1):
+        """Count writes, sweeping expired entries and evicting beyond max_size."""
+        self._writes_since_sweep += count
+        if self._writes_since_sweep >= _SWEEP_INTERVAL:
+            self._clean_expired()
+        cache = self._cache
+        while len(cache) > self._max_size:
+            key, entry = cache.popitem(last=False)
+            self._release(entry)
+            if self._debug_enabled:
+                logger.debug("cache_evicted", key=key)
 
     async def get(self, key: str) -> Optional[Any]:
         """Get value by key."""
-        self._clean_expired()
-        entry = self._cache.get(key)
-        if entry is None or entry.is_expired():
-            logger.debug("cache_miss", key=key)
+        entry = self._get_entry(key)
+        if entry is None:
+            if self._debug_enabled:
+                logger.debug("cache_miss", key=key)
             return None
-        logger.debug("cache_hit", key=key)
+        if self._debug_enabled:
+            logger.debug("cache_hit", key=key)
         return entry.value
 
     async def set(self, key: str, value: Any, ttl: Optional[int] = None) -> bool:
         """Set value with optional TTL in seconds."""
-        self._cache[key] = CacheEntry(value, ttl)
-        logger.debug("cache_set", key=key, has_ttl=ttl is not None)
+        self._store(key, value, self._deadline(ttl))
+        self._record_writes()
+        if self._debug_enabled:
+            logger.debug("cache_set", key=key, has_ttl=ttl is not None)
         return True
 
     async def delete(self, key: str) -> bool:
         """Delete value by key."""
-        if key in self._cache:
-            del self._cache[key]
-            logger.debug("cache_deleted", key=key)
+        entry = self._cache.pop(key, None)
+        if entry is not None:
+            self._release(entry)
+            if self._debug_enabled:
+                logger.debug("cache_deleted", key=key)
             return True
-        logger.debug("cache_delete_not_found", key=key)
+        if self._debug_enabled:
+            logger.debug("cache_delete_not_found", key=key)
         return False
 
     async def exists(self, key: str) -> bool:
         """Check if key exists."""
-        self._clean_expired()
-        exists = key in self._cache and not self._cache[key].is_expired()
-        logger.debug("cache_exists_check", key=key, exists=exists)
+        exists = self._get_entry(key) is not None
+        if self._debug_enabled:
+            logger.debug("cache_exists_check", key=key, exists=exists)
         return exists
 
     async def expire(self, key: str, ttl: int) -> bool:
         """Set TTL on existing key."""
-        entry = self._cache.get(key)
+        entry = self._get_entry(key)
         if entry is None:
-            logger.debug("cache_expire_not_found", key=key)
+            if self._debug_enabled:
+                logger.debug("cache_expire_not_found", key=key)
             return False
-        entry.expires_at = datetime.now(UTC) + timedelta(seconds=ttl)
-        logger.debug("cache_expire_set", key=key, ttl=ttl)
+        entry.expires_at = self._deadline(ttl)
+        if self._debug_enabled:
+            logger.debug("cache_expire_set", key=key, ttl=ttl)
         return True
 
     async def get_ttl(self, key: str) -> Optional[int]:
         """Get remaining TTL for key."""
-        entry = self._cache.get(key)
+        entry = self._get_entry(key)
         if entry is None:
             return None
-        ttl = entry.get_ttl()
-        logger.debug("cache_ttl_retrieved", key=key, ttl=ttl)
+        ttl = entry.get_ttl(self._time())
+        if self._debug_enabled:
+            logger.debug("cache_ttl_retrieved", key=key, ttl=ttl)
         return ttl
 
-    async def increment(self, key: str, amount: int = 1) -> int:
-        """Increment numeric value."""
-        entry = self._cache.get(key)
+    def _add(self, key: str, amount: int) -> int:
+        """Add amount to the integer stored under key, starting from zero if absent."""
+        entry = self._get_entry(key)
         if entry is None:
-            self._cache[key] = CacheEntry(amount)
-            logger.debug("cache_increment_new", key=key, value=amount)
+            self._cache[key] = self._new_entry(amount, None)
+            self._record_writes()
+            if self._debug_enabled:
+                logger.debug("cache_increment_new", key=key, value=amount)
             return amount
 
         if not isinstance(entry.value, int):
             raise ValueError(f"Value for key {key} is not an integer")
 
         entry.value += amount
-        logger.debug("cache_incremented", key=key, new_value=entry.value)
+        if self._debug_enabled:
+            logger.debug("cache_incremented", key=key, new_value=entry.value)
         return entry.value
 
+    async def increment(self, key: str, amount: int = 1) -> int:
+        """Increment numeric value."""
+        return self._add(key, amount)
+
     async def decrement(self, key: str, amount: int = 1) -> int:
         """Decrement numeric value."""
-        return await self.increment(key, -amount)
+        return self._add(key, -amount)
 
     async def get_many(self, keys: List[str]) -> Dict[str, Any]:
         """Get multiple values by keys."""
-        self._clean_expired()
         result = {}
         for key in keys:
-            entry = self._cache.get(key)
-            if entry is not None and not entry.is_expired():
+            entry = self._get_entry(key)
+            if entry is not None:
                 result[key] = entry.value
-        logger.debug("cache_get_many", requested=len(keys), found=len(result))
+        if self._debug_enabled:
+            logger.debug("cache_get_many", requested=len(keys), found=len(result))
         return result
 
     async def set_many(self, items: Dict[str, Any], ttl: Optional[int] = None) -> bool:
         """Set multiple key-value pairs."""
+        store = self._store
+        expires_at = self._deadline(ttl)
         for key, value in items.items():
-            self._cache[key] = CacheEntry(value, ttl)
-        logger.debug("cache_set_many", count=len(items), has_ttl=ttl is not None)
+            store(key, value, expires_at)
+        self._record_writes(len(items))
+        if self._debug_enabled:
+            logger.debug("cache_set_many", count=len(items), has_ttl=ttl is not None)
         return True
 
     async def delete_many(self, keys: List[str]) -> int:
         """Delete multiple keys, return count deleted."""
+        cache = self._cache
+        release = self._release
         count = 0
         for key in keys:
-            if key in self._cache:
-                del self._cache[key]
+            entry = cache.pop(key, None)
+            if entry is not None:
+                release(entry)
                 count += 1
-        logger.debug("cache_delete_many", requested=len(keys), deleted=count)
+        if self._debug_enabled:
+            logger.debug("cache_delete_many", requested=len(keys), deleted=count)
         return count
 
     async def keys(self, pattern: str) -> List[str]:
         """Get keys matching pattern."""
         self._clean_expired()
-        # Simple pattern matching: * matches any characters
-        import re
-        regex_pattern = pattern.replace("*", ".*")
-        regex = re.compile(f"^{regex_pattern}$")
-
-        matching_keys = [k for k in self._cache.keys() if regex.match(k)]
-        logger.debug("cache_keys_pattern", pattern=pattern, count=len(matching_keys))
+        regex = _glob_to_regex(pattern)
+        matching_keys = [k for k in self._cache if regex.match(k)]
+        if self._debug_enabled:
+            logger.debug("cache_keys_pattern", pattern=pattern, count=len(matching_keys))
         return matching_keys
 
     async def delete_pattern(self, pattern: str) -> int:
@@ -164,8 +325,14 @@ class StubCacheRepository(CacheRepository):
     async def flush_all(self) -> bool:
         """Flush all cache entries."""
         count = len(self._cache)
+        room = _ENTRY_POOL_SIZE - len(self._free_entries)
+        for entry in itertools.islice(self._cache.values(), room):
+            entry.value = None
+            self._free_entries.append(entry)
         self._cache.clear()
-        logger.debug("cache_flushed", count=count)
+        self._writes_since_sweep = 0
+        if self._debug_enabled:
+            logger.debug("cache_flushed", count=count)
         return True
 
     async def get_json(self, key: str) -> Optional[Dict]:
@@ -175,16 +342,19 @@ class StubCacheRepository(CacheRepository):
             return None
         if isinstance(value, dict):
             return value
-        # If stored as string, parse it
-        if isinstance(value, (str, bytes)):
+        # If stored as encoded JSON, parse it; orjson reads bytes and str directly
+        if isinstance(value, (bytes, bytearray, memoryview, str)):
             try:
                 return orjson.loads(value)
-            except orjson.JSONDecodeError:
+            except ValueError:
                 logger.warning("cache_json_decode_error", key=key)
                 return None
         return None
 
     async def set_json(self, key: str, value: Dict, ttl: Optional[int] = None) -> bool:
-        """Set JSON value with optional TTL."""
-        # Store as dict directly in memory
+        """Set JSON value with optional TTL.
+
+        The dict is stored as-is rather than serialized, since reader and writer
+        share process memory; get_json returns the same object.
+        """
         return await self.set(key, value, ttl)
@@ -1,34 +1,88 @@
 """Stub chaos events repository implementation."""
 import structlog
+from collections import defaultdict
 from typing import List, Optional
+from test_coordinator_data_adapter.adapters.stub.field_index import FieldIndex
 from test_coordinator_data_adapter.interfaces import ChaosEventsRepository
 from test_coordinator_data_adapter.models import ChaosEvent, EventType, EventStatus
+from test_coordinator_data_adapter.logging_utils import is_debug_enabled
 
 logger = structlog.get_logger(__name__)
 
+_ACTIVE_STATUSES = frozenset({EventStatus.INJECTED, EventStatus.IN_PROGRESS})
+
 
 class StubChaosEventsRepository(ChaosEventsRepository):
     """In-memory stub implementation of chaos events repository."""
 
     def __init__(self):
         self._events: dict[str, ChaosEvent] = {}
+        self._by_run: FieldIndex[str] = FieldIndex()
+        self._by_type: FieldIndex[EventType] = FieldIndex()
+        self._by_service: FieldIndex[str] = FieldIndex()
+        # IDs of events in an active status, in the order they became active
+        self._active: dict[str, None] = {}
+        # Running recovery totals per event type, and each event's contribution
+        self._recovery_sum: dict[EventType, int] = defaultdict(int)
+        self._recovery_count: dict[EventType, int] = defaultdict(int)
+        self._recovery_by_event: dict[str, tuple[EventType, int]] = {}
+        self._debug_enabled = is_debug_enabled(logger)
         logger.info("stub_chaos_events_repository_initialized", storage="in-memory")
 
+    def _index(self, event: ChaosEvent):
+        """Add event to secondary indexes."""
+        event_id = event.event_id
+        self._by_run.index(event_id, event.run_id)
+        self._by_type.index(event_id, event.event_type)
+        self._by_service.index(event_id, event.target_service)
+        if event.status in _ACTIVE_STATUSES:
+            self._active.setdefault(event_id, None)
+        else:
+            self._active.pop(event_id, None)
+        self._track_recovery(event)
+
+    def _index_many(self, events: List[ChaosEvent]):
+        """Add events to secondary indexes, one bulk update per field index."""
+        self._by_run.index_many((e.event_id, (e.run_id,)) for e in events)
+        self._by_type.index_many((e.event_id, (e.event_type,)) for e in events)
+        self._by_service.index_many((e.event_id, (e.target_service,)) for e in events)
+        for event in events:
+            if event.status in _ACTIVE_STATUSES:
+                self._active.setdefault(event.event_id, None)
+            else:
+                self._active.pop(event.event_id, None)
+            self._track_recovery(event)
+
+    def _track_recovery(self, event: ChaosEvent):
+        """Update running recovery totals with event's current recovery time."""
+        previous = self._recovery_by_event.pop(event.event_id, None)
+        if previous is not None:
+            event_type, recovery_time_ms = previous
+            self._recovery_sum[event_type] -= recovery_time_ms
+            self._recovery_count[event_type] -= 1
+        if event.recovery_time_ms is not None:
+            self._recovery_by_event[event.event_id] = (event.event_type, event.recovery_time_ms)
+            self._recovery_sum[event.event_type] += event.recovery_time_ms
+            self._recovery_count[event.event_type] += 1
+
     async def create(self, event: ChaosEvent) -> ChaosEvent:
         """Create a new chaos event."""
         self._events[event.event_id] = event
-        logger.debug(
-            "chaos_event_created",
-            event_id=event.event_id,
-            event_type=event.event_type.value,
-            target_service=event.target_service,
-        )
+        self._index(event)
+        if self._debug_enabled:
+            logger.debug(
+                "chaos_event_created",
+                event_id=event.event_id,
+                event_type=event.event_type.value,
+                target_service=event.target_service,
+            )
         return event
 
     async def get_by_id(self, event_id: str) -> Optional[ChaosEvent]:
         """Get chaos event by ID."""
         event = self._events.get(event_id)
-        logger.debug("chaos_event_retrieved", event_id=event_id, found=event is not None)
+        if self._debug_enabled:
+            logger.debug("chaos_event_retrieved", event_id=event_id, found=event is not None)
         return event
 
     async def update(self, event: ChaosEvent) -> ChaosEvent:
@@ -37,24 +91,25 @@ class StubChaosEventsRepository(ChaosEventsRepository):
             logger.warning("chaos_event_not_found_for_update", event_id=event.event_id)
             raise ValueError(f"ChaosEvent {event.event_id} not found")
         self._events[event.event_id] = event
+        self._index(event)
         logger.debug("chaos_event_updated", event_id=event.event_id, status=event.status.value)
         return event
 
     async def get_by_run(self, run_id: str) -> List[ChaosEvent]:
         """Get all events for a test run."""
-        result = [e for e in self._events.values() if e.run_id == run_id]
+        result = [self._events[i] for i in self._by_run.ids(run_id)]
         logger.debug("chaos_events_retrieved_by_run", run_id=run_id, count=len(result))
         return result
 
     async def get_by_type(self, event_type: EventType) -> List[ChaosEvent]:
         """Get events by type."""
-        result = [e for e in self._events.values() if e.event_type == event_type]
+        result = [self._events[i] for i in self._by_type.ids(event_type)]
         logger.debug("chaos_events_retrieved_by_type", event_type=event_type.value, count=len(result))
         return result
 
     async def get_by_service(self, service_name: str) -> List[ChaosEvent]:
         """Get events by target service."""
-        result = [e for e in self._events.values() if e.target_service == service_name]
+        result = [self._events[i] for i in self._by_service.ids(service_name)]
         logger.debug("chaos_events_retrieved_by_service", service_name=service_name, count=len(result))
         return result
 
@@ -64,7 +119,9 @@ class StubChaosEventsRepository(ChaosEventsRepository):
         if not event:
             logger.warning("chaos_event_not_found_for_status_update", event_id=event_id)
             raise ValueError(f"ChaosEvent {event_id} not found")
-        event.status = status
+        event = event.model_copy(update={"status": status})
+        self._events[event_id] = event
+        self._index(event)
         logger.debug("chaos_event_status_updated", event_id=event_id, status=status.value)
         return event
 
@@ -74,34 +131,37 @@ class StubChaosEventsRepository(ChaosEventsRepository):
         if not event:
             logger.warning("chaos_event_not_found_for_recovery", event_id=event_id)
             raise ValueError(f"ChaosEvent {event_id} not found")
-        event.recovery_time_ms = recovery_time_ms
-        event.status = EventStatus.RECOVERED
+        event = event.model_copy(
+            update={"recovery_time_ms": recovery_time_ms, "status": EventStatus.RECOVERED}
+        )
+        self._events[event_id] = event
+        self._index(event)
         logger.debug("chaos_event_recovery_recorded", event_id=event_id, recovery_ms=recovery_time_ms)
         return event
 
     async def get_active_events(self) -> List[ChaosEvent]:
         """Get all active/in-progress chaos events."""
-        result = [
-            e
-            for e in self._events.values()
-            if e.status in [EventStatus.INJECTED, EventStatus.IN_PROGRESS]
-        ]
+        result = [self._events[i] for i in self._active]
         logger.debug("active_chaos_events_retrieved", count=len(result))
         return result
 
     async def calculate_average_recovery_time(self, event_type: EventType) -> float:
         """Calculate average recovery time for event type."""
-        events = [
-            e
-            for e in self._events.values()
-            if e.event_type == event_type and e.recovery_time_ms is not None
-        ]
-        if not events:
+        count = self._recovery_count.get(event_type, 0)
+        if not count:
             return 0.0
-        avg_recovery = sum(e.recovery_time_ms for e in events) / len(events)
+        avg_recovery = self._recovery_sum[event_type] / count
         logger.debug(
             "average_recovery_time_calculated",
             event_type=event_type.value,
             avg_ms=avg_recovery,
         )
         return avg_recovery
+
+    async def bulk_create(self, events: List[ChaosEvent]) -> List[ChaosEvent]:
+        """Bulk create chaos events."""
+        self._events.update({e.event_id: e for e in events})
+        self._index_many(events)
+        if self._debug_enabled:
+            logger.debug("chaos_events_bulk_created", count=len(events))
+        return events
@@ -1,8 +1,11 @@
 """Stub scenarios repository implementation."""
+import itertools
 import structlog
 from typing import List, Optional
+from test_coordinator_data_adapter.adapters.stub.field_index import FieldIndex
 from test_coordinator_data_adapter.interfaces import ScenariosRepository
 from test_coordinator_data_adapter.models import Scenario, ScenarioType, ScenarioStatus
+from test_coordinator_data_adapter.logging_utils import is_debug_enabled
 
 logger = structlog.get_logger(__name__)
 
@@ -12,22 +15,48 @@ class StubScenariosRepository(ScenariosRepository):
 
     def __init__(self):
         self._scenarios: dict[str, Scenario] = {}
+        self._by_type: FieldIndex[ScenarioType] = FieldIndex()
+        self._by_status: FieldIndex[ScenarioStatus] = FieldIndex()
+        self._by_tag: FieldIndex[str] = FieldIndex()
+        self._debug_enabled = is_debug_enabled(logger)
         logger.info("stub_scenarios_repository_initialized", storage="in-memory")
 
+    def _index(self, scenario: Scenario):
+        """Add scenario to secondary indexes."""
+        scenario_id = scenario.scenario_id
+        self._by_type.index(scenario_id, scenario.scenario_type)
+        self._by_status.index(scenario_id, scenario.status)
+        self._by_tag.index(scenario_id, *scenario.tags)
+
+    def _index_many(self, scenarios: List[Scenario]):
+        """Add scenarios to secondary indexes, one bulk update per index."""
+        self._by_type.index_many((s.scenario_id, (s.scenario_type,)) for s in scenarios)
+        self._by_status.index_many((s.scenario_id, (s.status,)) for s in scenarios)
+        self._by_tag.index_many((s.scenario_id, tuple(s.tags)) for s in scenarios)
+
+    def _unindex(self, scenario_id: str):
+        """Remove scenario from secondary indexes."""
+        self._by_type.remove(scenario_id)
+        self._by_status.remove(scenario_id)
+        self._by_tag.remove(scenario_id)
+
     async def create(self, scenario: Scenario) -> Scenario:
         """Create a new scenario."""
         self._scenarios[scenario.scenario_id] = scenario
-        logger.debug(
-            "scenario_created",
-            scenario_id=scenario.scenario_id,
-            scenario_type=scenario.scenario_type.value,
-        )
+        self._index(scenario)
+        if self._debug_enabled:
+            logger.debug(
+                "scenario_created",
+                scenario_id=scenario.scenario_id,
+                scenario_type=scenario.scenario_type.value,
+            )
         return scenario
 
     async def get_by_id(self, scenario_id: str) -> Optional[Scenario]:
         """Get scenario by ID."""
         scenario = self._scenarios.get(scenario_id)
-        logger.debug("scenario_retrieved", scenario_id=scenario_id, found=scenario is not None)
+        if self._debug_enabled:
+            logger.debug("scenario_retrieved", scenario_id=scenario_id, found=scenario is not None)
         return scenario
 
     async def update(self, scenario: Scenario) -> Scenario:
@@ -36,13 +65,14 @@ class StubScenariosRepository(ScenariosRepository):
             logger.warning("scenario_not_found_for_update", scenario_id=scenario.scenario_id)
             raise ValueError(f"Scenario {scenario.scenario_id} not found")
         self._scenarios[scenario.scenario_id] = scenario
+        self._index(scenario)
         logger.debug("scenario_updated", scenario_id=scenario.scenario_id)
         return scenario
 
     async def delete(self, scenario_id: str) -> bool:
         """Delete scenario by ID."""
-        if scenario_id in self._scenarios:
-            del self._scenarios[scenario_id]
+        if self._scenarios.pop(scenario_id, None) is not None:
+            self._unindex(scenario_id)
             logger.debug("scenario_deleted", scenario_id=scenario_id)
             return True
         logger.warning("scenario_not_found_for_delete", scenario_id=scenario_id)
@@ -50,20 +80,19 @@ class StubScenariosRepository(ScenariosRepository):
 
     async def list_all(self, limit: int = 100, offset: int = 0) -> List[Scenario]:
         """List all scenarios with pagination."""
-        all_scenarios = list(self._scenarios.values())
-        result = all_scenarios[offset : offset + limit]
-        logger.debug("scenarios_listed", total=len(all_scenarios), returned=len(result))
+        result = list(itertools.islice(self._scenarios.values(), offset, offset + limit))
+        logger.debug("scenarios_listed", total=len(self._scenarios), returned=len(result))
         return result
 
     async def get_by_type(self, scenario_type: ScenarioType) -> List[Scenario]:
         """Get scenarios by type."""
-        result = [s for s in self._scenarios.values() if s.scenario_type == scenario_type]
+        result = [self._scenarios[i] for i in self._by_type.ids(scenario_type)]
         logger.debug("scenarios_retrieved_by_type", scenario_type=scenario_type.value, count=len(result))
         return result
 
     async def get_by_status(self, status: ScenarioStatus) -> List[Scenario]:
         """Get scenarios by status."""
-        result = [s for s in self._scenarios.values() if s.status == status]
+        result = [self._scenarios[i] for i in self._by_status.ids(status)]
         logger.debug("scenarios_retrieved_by_status", status=status.value, count=len(result))
         return result
 
@@ -73,18 +102,28 @@ class StubScenariosRepository(ScenariosRepository):
         if not scenario:
             logger.warning("scenario_not_found_for_status_update", scenario_id=scenario_id)
             raise ValueError(f"Scenario {scenario_id} not found")
-        scenario.status = status
+        scenario = scenario.model_copy(update={"status": status})
+        self._scenarios[scenario_id] = scenario
+        self._by_status.index(scenario_id, status)
         logger.debug("scenario_status_updated", scenario_id=scenario_id, status=status.value)
         return scenario
 
     async def search_by_tag(self, tag: str) -> List[Scenario]:
         """Search scenarios by tag."""
-        result = [s for s in self._scenarios.values() if tag in s.tags]
+        result = [self._scenarios[i] for i in self._by_tag.ids(tag)]
         logger.debug("scenarios_searched_by_tag", tag=tag, count=len(result))
         return result
 
     async def get_active_scenarios(self) -> List[Scenario]:
         """Get all active scenarios."""
-        result = [s for s in self._scenarios.values() if s.status == ScenarioStatus.ACTIVE]
+        result = [self._scenarios[i] for i in self._by_status.ids(ScenarioStatus.ACTIVE)]
         logger.debug("active_scenarios_retrieved", count=len(result))
         return result
+
+    async def bulk_create(self, scenarios: List[Scenario]) -> List[Scenario]:
+        """Bulk create scenarios."""
+        self._scenarios.update({s.scenario_id: s for s in scenarios})
+        self._index_many(scenarios)
+        if self._debug_enabled:
+            logger.debug("scenarios_bulk_created", count=len(scenarios))
+        return scenarios
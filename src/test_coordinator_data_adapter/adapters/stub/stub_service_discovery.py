@@ -1,8 +1,12 @@
 """Stub service discovery repository implementation."""
+import heapq
+import time
 import structlog
-from datetime import datetime, UTC, timedelta
-from typing import List, Optional
+from datetime import datetime, UTC
+from typing import Dict, List, Optional
+from test_coordinator_data_adapter.adapters.stub.field_index import FieldIndex
 from test_coordinator_data_adapter.interfaces import ServiceDiscoveryRepository, ServiceInfo
+from test_coordinator_data_adapter.logging_utils import is_debug_enabled
 
 logger = structlog.get_logger(__name__)
 
@@ -12,24 +16,54 @@ class StubServiceDiscoveryRepository(ServiceDiscoveryRepository):
 
     def __init__(self):
         self._services: dict[str, ServiceInfo] = {}
+        self._by_name: FieldIndex[str] = FieldIndex()
+        # Min-heap of (last_seen epoch seconds, service_id). Heartbeats push new
+        # entries and leave superseded ones in place; _heartbeat_pushed holds the
+        # latest pushed timestamp per service so superseded entries can be skipped.
+        # Timestamps are floats so sweeps compare in C rather than via datetime.
+        self._heartbeats: list[tuple[float, str]] = []
+        self._heartbeat_pushed: dict[str, float] = {}
+        self._debug_enabled = is_debug_enabled(logger)
         logger.info("stub_service_discovery_repository_initialized", storage="in-memory")
 
+    def _push_heartbeat(self, service: ServiceInfo):
+        """Track service's last_seen in the heartbeat heap."""
+        last_seen = service.last_seen.timestamp()
+        self._heartbeat_pushed[service.service_id] = last_seen
+        heapq.heappush(self._heartbeats, (last_seen, service.service_id))
+        self._compact_heartbeats()
+
+    def _compact_heartbeats(self) -> bool:
+        """Rebuild the heartbeat heap once superseded entries outnumber live ones."""
+        if len(self._heartbeats) <= 2 * len(self._services) + 16:
+            return False
+        self._heartbeat_pushed = {
+            sid: s.last_seen.timestamp() for sid, s in self._services.items()
+        }
+        self._heartbeats = [(ts, sid) for sid, ts in self._heartbeat_pushed.items()]
+        heapq.heapify(self._heartbeats)
+        return True
+
     async def register(self, service: ServiceInfo) -> ServiceInfo:
         """Register a service."""
         self._services[service.service_id] = service
-        logger.debug(
-            "service_registered",
-            service_id=service.service_id,
-            service_name=service.service_name,
-            host=service.host,
-            grpc_port=service.grpc_port,
-        )
+        self._by_name.index(service.service_id, service.service_name)
+        self._push_heartbeat(service)
+        if self._debug_enabled:
+            logger.debug(
+                "service_registered",
+                service_id=service.service_id,
+                service_name=service.service_name,
+                host=service.host,
+                grpc_port=service.grpc_port,
+            )
         return service
 
     async def deregister(self, service_id: str) -> bool:
         """Deregister a service."""
-        if service_id in self._services:
-            del self._services[service_id]
+        if self._services.pop(service_id, None) is not None:
+            self._by_name.remove(service_id)
+            self._heartbeat_pushed.pop(service_id, None)
             logger.debug("service_deregistered", service_id=service_id)
             return True
         logger.warning("service_not_found_for_deregister", service_id=service_id)
@@ -38,21 +72,30 @@ class StubServiceDiscoveryRepository(ServiceDiscoveryRepository):
     async def get_service_by_id(self, service_id: str) -> Optional[ServiceInfo]:
         """Get service by ID."""
         service = self._services.get(service_id)
-        logger.debug("service_retrieved_by_id", service_id=service_id, found=service is not None)
+        if self._debug_enabled:
+            logger.debug("service_retrieved_by_id", service_id=service_id, found=service is not None)
         return service
 
+    async def get_many_by_ids(self, service_ids: List[str]) -> Dict[str, ServiceInfo]:
+        """Get services by ID, omitting missing IDs."""
+        services = self._services
+        found = {sid: service for sid in service_ids if (service := services.get(sid)) is not None}
+        if self._debug_enabled:
+            logger.debug("services_retrieved_by_ids", requested=len(service_ids), found=len(found))
+        return found
+
     async def get_service_by_name(self, service_name: str) -> Optional[ServiceInfo]:
         """Get service by name (returns first matching)."""
-        for service in self._services.values():
-            if service.service_name == service_name:
-                logger.debug("service_retrieved_by_name", service_name=service_name, service_id=service.service_id)
-                return service
+        for service_id in self._by_name.ids(service_name):
+            service = self._services[service_id]
+            logger.debug("service_retrieved_by_name", service_name=service_name, service_id=service_id)
+            return service
         logger.debug("service_not_found_by_name", service_name=service_name)
         return None
 
     async def list_services_by_name(self, service_name: str) -> List[ServiceInfo]:
         """List all instances of a service."""
-        services = [s for s in self._services.values() if s.service_name == service_name]
+        services = [self._services[i] for i in self._by_name.ids(service_name)]
         logger.debug("services_listed_by_name", service_name=service_name, count=len(services))
         return services
 
@@ -62,32 +105,54 @@ class StubServiceDiscoveryRepository(ServiceDiscoveryRepository):
         logger.debug("all_services_listed", count=len(services))
         return services
 
+    async def list_all_services_columns(self, columns: tuple[str, ...]) -> Dict[str, list]:
+        """List selected fields of all registered services as parallel lists."""
+        unknown = [c for c in columns if c not in ServiceInfo.model_fields]
+        if unknown:
+            raise ValueError(f"Unknown service columns: {', '.join(unknown)}")
+        services = self._services.values()
+        result = {column: [getattr(s, column) for s in services] for column in columns}
+        logger.debug("all_service_columns_listed", columns=columns, count=len(services))
+        return result
+
     async def update_heartbeat(self, service_id: str) -> ServiceInfo:
         """Update service heartbeat timestamp."""
         service = self._services.get(service_id)
         if not service:
             logger.warning("service_not_found_for_heartbeat", service_id=service_id)
             raise ValueError(f"Service {service_id} not found")
-        service.last_seen = datetime.now(UTC)
+        service = service.model_copy(update={"last_seen": datetime.now(UTC)})
+        self._services[service_id] = service
+        self._push_heartbeat(service)
         logger.debug("service_heartbeat_updated", service_id=service_id, last_seen=service.last_seen)
         return service
 
     async def remove_stale_services(self, threshold_seconds: int) -> int:
         """Remove services not seen within threshold."""
-        now = datetime.now(UTC)
-        threshold_time = now - timedelta(seconds=threshold_seconds)
-
-        stale_services = [
-            service_id
-            for service_id, service in self._services.items()
-            if service.last_seen < threshold_time
-        ]
-
-        for service_id in stale_services:
-            del self._services[service_id]
-
-        logger.debug("stale_services_removed", count=len(stale_services), threshold_seconds=threshold_seconds)
-        return len(stale_services)
+        # last_seen is caller-supplied wall-clock time, so compare against time.time()
+        cutoff = time.time() - threshold_seconds
+
+        heartbeats = self._heartbeats
+        removed = 0
+        moved = []
+        while heartbeats and heartbeats[0][0] < cutoff:
+            last_seen, service_id = heapq.heappop(heartbeats)
+            service = self._services.get(service_id)
+            if service is None:
+                continue
+            if service.last_seen.timestamp() < cutoff:
+                del self._services[service_id]
+                self._by_name.remove(service_id)
+                self._heartbeat_pushed.pop(service_id, None)
+                removed += 1
+            elif self._heartbeat_pushed.get(service_id) == last_seen:
+                # last_seen was changed without a heartbeat
+                moved.append(service)
+        for service in moved:
+            self._push_heartbeat(service)
+
+        logger.debug("stale_services_removed", count=removed, threshold_seconds=threshold_seconds)
+        return removed
 
     async def is_service_healthy(self, service_id: str, threshold_seconds: int) -> bool:
         """Check if service is healthy based on last heartbeat."""
@@ -96,9 +161,7 @@ class StubServiceDiscoveryRepository(ServiceDiscoveryRepository):
             logger.debug("service_not_found_for_health_check", service_id=service_id)
             return False
 
-        now = datetime.now(UTC)
-        threshold_time = now - timedelta(seconds=threshold_seconds)
-        is_healthy = service.last_seen >= threshold_time
+        is_healthy = service.last_seen.timestamp() >= time.time() - threshold_seconds
 
         logger.debug(
             "service_health_checked",
@@ -113,3 +176,16 @@ class StubServiceDiscoveryRepository(ServiceDiscoveryRepository):
         count = len(self._services)
         logger.debug("service_count_retrieved", count=count)
         return count
+
+    async def bulk_register(self, services: List[ServiceInfo]) -> List[ServiceInfo]:
+        """Register multiple services."""
+        self._services.update({s.service_id: s for s in services})
+        self._by_name.index_many((s.service_id, (s.service_name,)) for s in services)
+        pushed = {s.service_id: s.last_seen.timestamp() for s in services}
+        self._heartbeat_pushed.update(pushed)
+        self._heartbeats.extend((ts, sid) for sid, ts in pushed.items())
+        if not self._compact_heartbeats():
+            heapq.heapify(self._heartbeats)
+        if self._debug_enabled:
+            logger.debug("services_bulk_registered", count=len(services))
+        return services
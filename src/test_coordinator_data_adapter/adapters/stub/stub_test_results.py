@@ -1,8 +1,10 @@
 """Stub test results repository implementation."""
 import structlog
-from typing import List, Optional
+from typing import Dict, List, Optional
+from test_coordinator_data_adapter.adapters.stub.field_index import FieldIndex
 from test_coordinator_data_adapter.models import TestResult, ResultStatus, AssertionType
 from test_coordinator_data_adapter.interfaces import TestResultsRepository
+from test_coordinator_data_adapter.logging_utils import is_debug_enabled
 
 logger = structlog.get_logger(__name__)
 
@@ -12,35 +14,66 @@ class StubTestResultsRepository(TestResultsRepository):
 
     def __init__(self):
         self._results: dict[str, TestResult] = {}
+        self._by_run: FieldIndex[str] = FieldIndex()
+        self._by_assertion_type: FieldIndex[AssertionType] = FieldIndex()
+        self._by_status: FieldIndex[ResultStatus] = FieldIndex()
+        self._by_correlation_id: FieldIndex[Optional[str]] = FieldIndex()
+        self._by_run_status: FieldIndex[tuple[str, ResultStatus]] = FieldIndex()
+        self._by_assertion_status: FieldIndex[tuple[AssertionType, ResultStatus]] = FieldIndex()
+        self._debug_enabled = is_debug_enabled(logger)
         logger.info("stub_test_results_repository_initialized", storage="in-memory")
 
+    def _index(self, result: TestResult):
+        """Add result to secondary indexes."""
+        result_id = result.result_id
+        self._by_run.index(result_id, result.run_id)
+        self._by_assertion_type.index(result_id, result.assertion_type)
+        self._by_status.index(result_id, result.status)
+        self._by_correlation_id.index(result_id, result.correlation_id)
+        self._by_run_status.index(result_id, (result.run_id, result.status))
+        self._by_assertion_status.index(result_id, (result.assertion_type, result.status))
+
+    def _index_many(self, results: List[TestResult]):
+        """Add results to secondary indexes, one bulk update per index."""
+        self._by_run.index_many((r.result_id, (r.run_id,)) for r in results)
+        self._by_assertion_type.index_many((r.result_id, (r.assertion_type,)) for r in results)
+        self._by_status.index_many((r.result_id, (r.status,)) for r in results)
+        self._by_correlation_id.index_many((r.result_id, (r.correlation_id,)) for r in results)
+        self._by_run_status.index_many((r.result_id, ((r.run_id, r.status),)) for r in results)
+        self._by_assertion_status.index_many(
+            (r.result_id, ((r.assertion_type, r.status),)) for r in results
+        )
+
     async def create(self, result: TestResult) -> TestResult:
         """Create a new test result."""
         self._results[result.result_id] = result
-        logger.debug(
-            "test_result_created",
-            result_id=result.result_id,
-            run_id=result.run_id,
-            assertion_type=result.assertion_type.value,
-            status=result.status.value,
-        )
+        self._index(result)
+        if self._debug_enabled:
+            logger.debug(
+                "test_result_created",
+                result_id=result.result_id,
+                run_id=result.run_id,
+                assertion_type=result.assertion_type.value,
+                status=result.status.value,
+            )
         return result
 
     async def get_by_id(self, result_id: str) -> Optional[TestResult]:
         """Get test result by ID."""
         result = self._results.get(result_id)
-        logger.debug("test_result_retrieved", result_id=result_id, found=result is not None)
+        if self._debug_enabled:
+            logger.debug("test_result_retrieved", result_id=result_id, found=result is not None)
         return result
 
     async def get_by_run(self, run_id: str) -> List[TestResult]:
         """Get all results for a test run."""
-        results = [r for r in self._results.values() if r.run_id == run_id]
+        results = [self._results[i] for i in self._by_run.ids(run_id)]
         logger.debug("test_results_retrieved_by_run", run_id=run_id, count=len(results))
         return results
 
     async def get_by_assertion_type(self, assertion_type: AssertionType) -> List[TestResult]:
         """Get results by assertion type."""
-        results = [r for r in self._results.values() if r.assertion_type == assertion_type]
+        results = [self._results[i] for i in self._by_assertion_type.ids(assertion_type)]
         logger.debug(
             "test_results_retrieved_by_assertion_type",
             assertion_type=assertion_type.value,
@@ -50,46 +83,54 @@ class StubTestResultsRepository(TestResultsRepository):
 
     async def get_by_status(self, status: ResultStatus) -> List[TestResult]:
         """Get results by status."""
-        results = [r for r in self._results.values() if r.status == status]
+        results = [self._results[i] for i in self._by_status.ids(status)]
         logger.debug("test_results_retrieved_by_status", status=status.value, count=len(results))
         return results
 
     async def get_failed_results(self, run_id: str) -> List[TestResult]:
         """Get all failed results for a run."""
         results = [
-            r for r in self._results.values() if r.run_id == run_id and r.status == ResultStatus.FAILED
+            self._results[i] for i in self._by_run_status.ids((run_id, ResultStatus.FAILED))
         ]
         logger.debug("failed_test_results_retrieved", run_id=run_id, count=len(results))
         return results
 
     async def get_by_correlation_id(self, correlation_id: str) -> List[TestResult]:
         """Get results by audit correlation ID."""
-        results = [r for r in self._results.values() if r.correlation_id == correlation_id]
+        results = [self._results[i] for i in self._by_correlation_id.ids(correlation_id)]
         logger.debug("test_results_retrieved_by_correlation", correlation_id=correlation_id, count=len(results))
         return results
 
     async def calculate_pass_rate(self, run_id: str) -> float:
         """Calculate pass rate for a test run."""
-        run_results = [r for r in self._results.values() if r.run_id == run_id]
-        if not run_results:
+        total = self._by_run.count(run_id)
+        if not total:
             return 0.0
-        passed = sum(1 for r in run_results if r.status == ResultStatus.PASSED)
-        pass_rate = passed / len(run_results)
+        pass_rate = self._by_run_status.count((run_id, ResultStatus.PASSED)) / total
         logger.debug("pass_rate_calculated", run_id=run_id, rate=pass_rate)
         return pass_rate
 
     async def count_by_status(self, run_id: str, status: ResultStatus) -> int:
         """Count results by status for a run."""
-        count = sum(
-            1 for r in self._results.values() if r.run_id == run_id and r.status == status
-        )
+        count = self._by_run_status.count((run_id, status))
         logger.debug("results_counted_by_status", run_id=run_id, status=status.value, count=count)
         return count
 
+    async def get_status_counts(self, run_id: str) -> Dict[ResultStatus, int]:
+        """Get result counts per status for a run."""
+        counts = {
+            status: count
+            for status in ResultStatus
+            if (count := self._by_run_status.count((run_id, status)))
+        }
+        if self._debug_enabled:
+            logger.debug("result_status_counts_retrieved", run_id=run_id, statuses=len(counts))
+        return counts
+
     async def get_assertion_statistics(self, assertion_type: AssertionType) -> dict:
         """Get statistics for an assertion type."""
-        results = [r for r in self._results.values() if r.assertion_type == assertion_type]
-        if not results:
+        total = self._by_assertion_type.count(assertion_type)
+        if not total:
             return {
                 "total": 0,
                 "passed": 0,
@@ -98,16 +139,16 @@ class StubTestResultsRepository(TestResultsRepository):
                 "pass_rate": 0.0,
             }
 
-        passed = sum(1 for r in results if r.status == ResultStatus.PASSED)
-        failed = sum(1 for r in results if r.status == ResultStatus.FAILED)
-        skipped = sum(1 for r in results if r.status == ResultStatus.SKIPPED)
+        passed = self._by_assertion_status.count((assertion_type, ResultStatus.PASSED))
+        failed = self._by_assertion_status.count((assertion_type, ResultStatus.FAILED))
+        skipped = self._by_assertion_status.count((assertion_type, ResultStatus.SKIPPED))
 
         stats = {
-            "total": len(results),
+            "total": total,
             "passed": passed,
             "failed": failed,
             "skipped": skipped,
-            "pass_rate": passed / len(results) if results else 0.0,
+            "pass_rate": passed / total,
         }
 
         logger.debug(
@@ -119,7 +160,8 @@ class StubTestResultsRepository(TestResultsRepository):
 
     async def bulk_create(self, results: List[TestResult]) -> List[TestResult]:
         """Bulk create test results."""
-        for result in results:
-            self._results[result.result_id] = result
-        logger.debug("test_results_bulk_created", count=len(results))
+        self._results.update({r.result_id: r for r in results})
+        self._index_many(results)
+        if self._debug_enabled:
+            logger.debug("test_results_bulk_created", count=len(results))
         return results
@@ -1,61 +1,198 @@
 """Stub test runs repository implementation."""
+import bisect
+import heapq
+import itertools
+import operator
+import time
 import structlog
+from collections import defaultdict
 from datetime import datetime, UTC
-from typing import List, Optional
+from typing import Collection, Dict, Iterator, List, Optional
+from test_coordinator_data_adapter.adapters.stub.field_index import FieldIndex
 from test_coordinator_data_adapter.interfaces import TestRunsRepository
 from test_coordinator_data_adapter.models import TestRun, RunStatus
+from test_coordinator_data_adapter.logging_utils import is_debug_enabled
 
 logger = structlog.get_logger(__name__)
 
+_STARTED_AT = operator.itemgetter(0)
+
+
+def _newest(runs: Collection[TestRun], attr: str, limit: int) -> List[TestRun]:
+    """Get up to limit runs, newest attr first, then runs where attr is unset."""
+    get = operator.attrgetter(attr)
+    stamped = [r for r in runs if get(r) is not None]
+    result = heapq.nlargest(limit, stamped, key=get)
+    if len(result) < limit and len(stamped) < len(runs):
+        unstamped = (r for r in runs if get(r) is None)
+        result.extend(itertools.islice(unstamped, limit - len(result)))
+    return result
+
 
 class StubTestRunsRepository(TestRunsRepository):
     """In-memory stub implementation of test runs repository."""
 
     def __init__(self):
         self._runs: dict[str, TestRun] = {}
+        self._by_scenario: FieldIndex[str] = FieldIndex()
+        self._by_status: FieldIndex[RunStatus] = FieldIndex()
+        self._by_scenario_status: FieldIndex[tuple[str, RunStatus]] = FieldIndex()
+        # Running duration totals per scenario, and each run's contribution
+        self._duration_sum: dict[str, int] = defaultdict(int)
+        self._duration_count: dict[str, int] = defaultdict(int)
+        self._duration_by_run: dict[str, tuple[str, int]] = {}
+        # Monotonic start time of runs started here, keyed with the started_at it matches
+        self._started_ns: dict[str, tuple[datetime, int]] = {}
+        # (started_at, run_id) of started runs in ascending order, and each run's key
+        self._by_started: list[tuple[datetime, str]] = []
+        self._started_keys: dict[str, tuple[datetime, str]] = {}
+        self._debug_enabled = is_debug_enabled(logger)
         logger.info("stub_test_runs_repository_initialized", storage="in-memory")
 
+    def _index(self, run: TestRun):
+        """Add run to secondary indexes and running totals."""
+        self._by_scenario.index(run.run_id, run.scenario_id)
+        self._index_status(run)
+        self._index_started(run)
+        self._track_duration(run)
+
+    def _index_status(self, run: TestRun):
+        """Move run to the index buckets for its current status."""
+        self._by_status.index(run.run_id, run.status)
+        self._by_scenario_status.index(run.run_id, (run.scenario_id, run.status))
+
+    def _unindex(self, run_id: str):
+        """Remove run from secondary indexes and running totals."""
+        self._by_scenario.remove(run_id)
+        self._by_status.remove(run_id)
+        self._by_scenario_status.remove(run_id)
+        self._untrack_duration(run_id)
+        self._started_ns.pop(run_id, None)
+        self._unindex_started(run_id)
+
+    def _index_started(self, run: TestRun):
+        """Move run to its position in the started_at ordering."""
+        key = (run.started_at, run.run_id) if run.started_at is not None else None
+        if self._started_keys.get(run.run_id) == key:
+            return
+        self._unindex_started(run.run_id)
+        if key is not None:
+            bisect.insort(self._by_started, key)
+            self._started_keys[run.run_id] = key
+
+    def _unindex_started(self, run_id: str):
+        """Remove run from the started_at ordering."""
+        key = self._started_keys.pop(run_id, None)
+        if key is not None:
+            del self._by_started[bisect.bisect_left(self._by_started, key)]
+
+    def _track_duration(self, run: TestRun):
+        """Update running duration totals with run's current duration."""
+        self._untrack_duration(run.run_id)
+        if run.duration_ms is not None:
+            self._duration_by_run[run.run_id] = (run.scenario_id, run.duration_ms)
+            self._duration_sum[run.scenario_id] += run.duration_ms
+            self._duration_count[run.scenario_id] += 1
+
+    def _untrack_duration(self, run_id: str):
+        """Remove run's duration from the running totals."""
+        previous = self._duration_by_run.pop(run_id, None)
+        if previous is not None:
+            scenario_id, duration_ms = previous
+            self._duration_sum[scenario_id] -= duration_ms
+            self._duration_count[scenario_id] -= 1
+
     async def create(self, run: TestRun) -> TestRun:
         """Create a new test run."""
         self._runs[run.run_id] = run
-        logger.debug("test_run_created", run_id=run.run_id, scenario_id=run.scenario_id)
+        self._index(run)
+        if self._debug_enabled:
+            logger.debug("test_run_created", run_id=run.run_id, scenario_id=run.scenario_id)
         return run
 
     async def get_by_id(self, run_id: str) -> Optional[TestRun]:
         """Get test run by ID."""
         run = self._runs.get(run_id)
-        logger.debug("test_run_retrieved", run_id=run_id, found=run is not None)
+        if self._debug_enabled:
+            logger.debug("test_run_retrieved", run_id=run_id, found=run is not None)
         return run
 
+    async def get_many_by_ids(self, run_ids: List[str]) -> Dict[str, TestRun]:
+        """Get test runs by ID, omitting missing IDs."""
+        runs = self._runs
+        found = {run_id: run for run_id in run_ids if (run := runs.get(run_id)) is not None}
+        if self._debug_enabled:
+            logger.debug("test_runs_retrieved_by_ids", requested=len(run_ids), found=len(found))
+        return found
+
     async def update(self, run: TestRun) -> TestRun:
         """Update existing test run."""
         if run.run_id not in self._runs:
             logger.warning("test_run_not_found_for_update", run_id=run.run_id)
             raise ValueError(f"TestRun {run.run_id} not found")
         self._runs[run.run_id] = run
-        logger.debug("test_run_updated", run_id=run.run_id, status=run.status.value)
+        self._index(run)
+        if self._debug_enabled:
+            logger.debug("test_run_updated", run_id=run.run_id, status=run.status.value)
         return run
 
     async def get_by_scenario(self, scenario_id: str) -> List[TestRun]:
         """Get all runs for a scenario."""
-        result = [r for r in self._runs.values() if r.scenario_id == scenario_id]
-        logger.debug("test_runs_retrieved_by_scenario", scenario_id=scenario_id, count=len(result))
+        result = list(self.iter_by_scenario(scenario_id))
+        if self._debug_enabled:
+            logger.debug("test_runs_retrieved_by_scenario", scenario_id=scenario_id, count=len(result))
         return result
 
     async def get_by_status(self, status: RunStatus) -> List[TestRun]:
         """Get runs by status."""
-        result = [r for r in self._runs.values() if r.status == status]
-        logger.debug("test_runs_retrieved_by_status", status=status.value, count=len(result))
+        result = list(self.iter_by_status(status))
+        if self._debug_enabled:
+            logger.debug("test_runs_retrieved_by_status", status=status.value, count=len(result))
         return result
 
+    async def count_by_scenario(self, scenario_id: str) -> int:
+        """Count runs for a scenario."""
+        count = self._by_scenario.count(scenario_id)
+        if self._debug_enabled:
+            logger.debug("test_runs_counted_by_scenario", scenario_id=scenario_id, count=count)
+        return count
+
+    async def count_by_status(self, status: RunStatus) -> int:
+        """Count runs by status."""
+        count = self._by_status.count(status)
+        if self._debug_enabled:
+            logger.debug("test_runs_counted_by_status", status=status.value, count=count)
+        return count
+
+    def iter_by_scenario(self, scenario_id: str) -> Iterator[TestRun]:
+        """Iterate runs for a scenario without building a list.
+
+        The repository must not be modified while the iterator is in use.
+        """
+        runs = self._runs
+        for run_id in self._by_scenario.ids(scenario_id):
+            yield runs[run_id]
+
+    def iter_by_status(self, status: RunStatus) -> Iterator[TestRun]:
+        """Iterate runs with status without building a list.
+
+        The repository must not be modified while the iterator is in use.
+        """
+        runs = self._runs
+        for run_id in self._by_status.ids(status):
+            yield runs[run_id]
+
     async def update_status(self, run_id: str, status: RunStatus) -> TestRun:
         """Update run status."""
         run = self._runs.get(run_id)
         if not run:
             logger.warning("test_run_not_found_for_status_update", run_id=run_id)
             raise ValueError(f"TestRun {run_id} not found")
-        run.status = status
-        logger.debug("test_run_status_updated", run_id=run_id, status=status.value)
+        run = run.model_copy(update={"status": status})
+        self._runs[run_id] = run
+        self._index_status(run)
+        if self._debug_enabled:
+            logger.debug("test_run_status_updated", run_id=run_id, status=status.value)
         return run
 
     async def start_run(self, run_id: str) -> TestRun:
@@ -64,9 +201,23 @@ class StubTestRunsRepository(TestRunsRepository):
         if not run:
             logger.warning("test_run_not_found_for_start", run_id=run_id)
             raise ValueError(f"TestRun {run_id} not found")
-        run.status = RunStatus.RUNNING
-        run.started_at = datetime.now(UTC)
-        logger.debug("test_run_started", run_id=run_id)
+        run = run.model_copy(update={"status": RunStatus.RUNNING, "started_at": datetime.now(UTC)})
+        self._runs[run_id] = run
+        self._index_status(run)
+        self._started_ns[run_id] = (run.started_at, time.monotonic_ns())
+        self._index_started(run)
+        if self._debug_enabled:
+            logger.debug("test_run_started", run_id=run_id)
+        return run
+
+    async def create_started_run(self, run: TestRun) -> TestRun:
+        """Create a test run already started, like create followed by start_run."""
+        run = run.model_copy(update={"status": RunStatus.RUNNING, "started_at": datetime.now(UTC)})
+        self._runs[run.run_id] = run
+        self._index(run)
+        self._started_ns[run.run_id] = (run.started_at, time.monotonic_ns())
+        if self._debug_enabled:
+            logger.debug("test_run_started", run_id=run.run_id, scenario_id=run.scenario_id)
         return run
 
     async def complete_run(self, run_id: str, status: RunStatus, exit_code: Optional[int] = None) -> TestRun:
@@ -75,42 +226,77 @@ class StubTestRunsRepository(TestRunsRepository):
         if not run:
             logger.warning("test_run_not_found_for_completion", run_id=run_id)
             raise ValueError(f"TestRun {run_id} not found")
-        run.status = status
-        run.completed_at = datetime.now(UTC)
-        run.exit_code = exit_code
-        if run.started_at:
-            run.duration_ms = int((run.completed_at - run.started_at).total_seconds() * 1000)
-        logger.debug("test_run_completed", run_id=run_id, status=status.value, duration_ms=run.duration_ms)
+        run = self._complete(run, status, exit_code, datetime.now(UTC), time.monotonic_ns())
+        if self._debug_enabled:
+            logger.debug("test_run_completed", run_id=run_id, status=status.value, duration_ms=run.duration_ms)
+        return run
+
+    async def complete_runs(
+        self, completions: List[tuple[str, RunStatus, Optional[int]]]
+    ) -> List[TestRun]:
+        """Complete multiple test runs, stamping them with one completion time.
+
+        All run IDs are checked before any run is changed.
+        """
+        runs = []
+        for run_id, _, _ in completions:
+            run = self._runs.get(run_id)
+            if not run:
+                logger.warning("test_run_not_found_for_completion", run_id=run_id)
+                raise ValueError(f"TestRun {run_id} not found")
+            runs.append(run)
+        completed_at = datetime.now(UTC)
+        now_ns = time.monotonic_ns()
+        completed = [
+            self._complete(run, status, exit_code, completed_at, now_ns)
+            for run, (_, status, exit_code) in zip(runs, completions)
+        ]
+        if self._debug_enabled:
+            logger.debug("test_runs_completed", count=len(completed))
+        return completed
+
+    def _complete(
+        self,
+        run: TestRun,
+        status: RunStatus,
+        exit_code: Optional[int],
+        completed_at: datetime,
+        now_ns: int,
+    ) -> TestRun:
+        """Store a completed copy of run stamped with the given wall-clock and monotonic times."""
+        update = {"status": status, "completed_at": completed_at, "exit_code": exit_code}
+        started = self._started_ns.pop(run.run_id, None)
+        if started is not None and started[0] is run.started_at:
+            update["duration_ms"] = (now_ns - started[1]) // 1_000_000
+        elif run.started_at:
+            update["duration_ms"] = int((completed_at - run.started_at).total_seconds() * 1000)
+        run = run.model_copy(update=update)
+        self._runs[run.run_id] = run
+        self._index_status(run)
+        self._track_duration(run)
         return run
 
     async def get_recent_runs(self, limit: int = 10) -> List[TestRun]:
         """Get most recent test runs."""
-        sorted_runs = sorted(
-            self._runs.values(),
-            key=lambda r: r.started_at or datetime.min.replace(tzinfo=UTC),
-            reverse=True,
-        )
-        result = sorted_runs[:limit]
-        logger.debug("recent_test_runs_retrieved", count=len(result))
+        result = _newest(self._runs.values(), "started_at", limit)
+        if self._debug_enabled:
+            logger.debug("recent_test_runs_retrieved", count=len(result))
         return result
 
     async def get_failed_runs(self, limit: int = 10) -> List[TestRun]:
         """Get recent failed runs."""
-        failed_runs = [r for r in self._runs.values() if r.status == RunStatus.FAILED]
-        sorted_runs = sorted(
-            failed_runs,
-            key=lambda r: r.completed_at or datetime.min.replace(tzinfo=UTC),
-            reverse=True,
-        )
-        result = sorted_runs[:limit]
-        logger.debug("failed_test_runs_retrieved", count=len(result))
+        failed_runs = [self._runs[i] for i in self._by_status.ids(RunStatus.FAILED)]
+        result = _newest(failed_runs, "completed_at", limit)
+        if self._debug_enabled:
+            logger.debug("failed_test_runs_retrieved", count=len(result))
         return result
 
     async def delete(self, run_id: str) -> bool:
         """Delete test run by ID."""
-        if run_id in self._runs:
-            del self._runs[run_id]
-            logger.debug("test_run_deleted", run_id=run_id)
+        if self._runs.pop(run_id, None) is not None:
+            self._unindex(run_id)
+            if self._debug_enabled:
+                logger.debug("test_run_deleted", run_id=run_id)
             return True
         logger.warning("test_run_not_found_for_delete", run_id=run_id)
         return False
@@ -121,38 +307,48 @@ class StubTestRunsRepository(TestRunsRepository):
         if not run:
             logger.warning("test_run_not_found_for_completion", run_id=run_id)
             raise ValueError(f"TestRun {run_id} not found")
-        run.completed_at = datetime.now(UTC)
-        run.exit_code = exit_code
-        run.duration_ms = duration_ms
-        # Determine status from exit code
-        run.status = RunStatus.PASSED if exit_code == 0 else RunStatus.FAILED
-        logger.debug("test_run_completion_recorded", run_id=run_id, status=run.status.value, duration_ms=duration_ms)
+        run = run.model_copy(
+            update={
+                "completed_at": datetime.now(UTC),
+                "exit_code": exit_code,
+                "duration_ms": duration_ms,
+                # Determine status from exit code
+                "status": RunStatus.PASSED if exit_code == 0 else RunStatus.FAILED,
+            }
+        )
+        self._runs[run_id] = run
+        self._track_duration(run)
+        self._index_status(run)
+        if self._debug_enabled:
+            logger.debug("test_run_completion_recorded", run_id=run_id, status=run.status.value, duration_ms=duration_ms)
         return run
 
     async def get_runs_by_date_range(self, start: datetime, end: datetime) -> List[TestRun]:
-        """Get runs within date range."""
-        result = [
-            r for r in self._runs.values()
-            if r.started_at and start <= r.started_at <= end
-        ]
-        logger.debug("test_runs_retrieved_by_date_range", count=len(result))
+        """Get runs within date range, ordered by start time."""
+        by_started = self._by_started
+        lo = bisect.bisect_left(by_started, start, key=_STARTED_AT)
+        hi = bisect.bisect_right(by_started, end, lo=lo, key=_STARTED_AT)
+        result = [self._runs[run_id] for _, run_id in by_started[lo:hi]]
+        if self._debug_enabled:
+            logger.debug("test_runs_retrieved_by_date_range", count=len(result))
         return result
 
     async def calculate_pass_rate(self, scenario_id: str) -> float:
         """Calculate pass rate for a scenario."""
-        runs = [r for r in self._runs.values() if r.scenario_id == scenario_id]
-        if not runs:
+        total = self._by_scenario.count(scenario_id)
+        if not total:
             return 0.0
-        passed = sum(1 for r in runs if r.status == RunStatus.PASSED)
-        pass_rate = passed / len(runs)
-        logger.debug("pass_rate_calculated", scenario_id=scenario_id, rate=pass_rate)
+        pass_rate = self._by_scenario_status.count((scenario_id, RunStatus.PASSED)) / total
+        if self._debug_enabled:
+            logger.debug("pass_rate_calculated", scenario_id=scenario_id, rate=pass_rate)
         return pass_rate
 
     async def get_average_duration(self, scenario_id: str) -> float:
         """Get average duration for scenario runs."""
-        runs = [r for r in self._runs.values() if r.scenario_id == scenario_id and r.duration_ms is not None]
-        if not runs:
+        count = self._duration_count.get(scenario_id, 0)
+        if not count:
             return 0.0
-        avg_duration = sum(r.duration_ms for r in runs) / len(runs)
-        logger.debug("average_duration_calculated", scenario_id=scenario_id, avg_ms=avg_duration)
+        avg_duration = self._duration_sum[scenario_id] / count
+        if self._debug_enabled:
+            logger.debug("average_duration_calculated", scenario_id=scenario_id, avg_ms=avg_duration)
         return avg_duration
@@ -0,0 +1,60 @@
+"""Request-scoped batch loading for repository lookups by ID."""
+import asyncio
+from typing import Awaitable, Callable, Dict, Generic, List, Optional, TypeVar
+
+K = TypeVar("K")
+V = TypeVar("V")
+
+
+class BatchLoader(Generic[K, V]):
+    """Coalesce single-key loads made within one event loop tick into one batch call.
+
+    Wraps a repository's get_many_by_ids: concurrent load() calls queue their
+    keys, and the queue is flushed as one get_many_by_ids call on the next loop
+    iteration. Repeated keys in a batch share one result. Nothing is cached
+    across batches, so create one loader per request.
+    """
+
+    def __init__(self, load_many: Callable[[List[K]], Awaitable[Dict[K, V]]]):
+        self._load_many = load_many
+        self._pending: dict[K, asyncio.Future] = {}
+        self._flushes: set[asyncio.Task] = set()
+
+    async def load(self, key: K) -> Optional[V]:
+        """Load value for key, or None if it does not exist."""
+        future = self._pending.get(key)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            if not self._pending:
+                loop.call_soon(self._dispatch)
+            future = self._pending[key] = loop.create_future()
+        # Shielded so one cancelled caller doesn't cancel the result for the others
+        return await asyncio.shield(future)
+
+    async def load_many(self, keys: List[K]) -> List[Optional[V]]:
+        """Load values for keys in order, with None for missing keys."""
+        return list(await asyncio.gather(*(self.load(key) for key in keys)))
+
+    def _dispatch(self):
+        """Start flushing the keys queued so far."""
+        pending, self._pending = self._pending, {}
+        task = asyncio.ensure_future(self._flush(pending))
+        self._flushes.add(task)
+        task.add_done_callback(self._flushes.discard)
+
+    async def _flush(self, pending: dict[K, asyncio.Future]):
+        """Load queued keys in one call and resolve their futures."""
+        try:
+            found = await self._load_many(list(pending))
+        except Exception as e:
+            for future in pending.values():
+                if not future.done():
+                    future.set_exception(e)
+            return
+        except BaseException:
+            for future in pending.values():
+                future.cancel()
+            raise
+        for key, future in pending.items():
+            if not future.done():
+                future.set_result(found.get(key))
@@ -33,6 +33,7 @@ class AdapterConfig(BaseSettings):
     cache_ttl_scenarios: int = 600
     cache_ttl_test_runs: int = 300
     cache_ttl_results: int = 180
+    cache_max_entries: int = 1_000_000
 
     # Service identity
     service_name: str = "test-coordinator"
@@ -58,3 +59,5 @@ class AdapterConfig(BaseSettings):
 
     # Health check timeout
     health_check_timeout: int = 5
+    # Seconds a successful PostgreSQL probe is reused before querying again
+    postgres_health_cache_seconds: int = 10
@@ -1,6 +1,9 @@
 """Factory for creating repository instances with connection management."""
+import asyncio
+import functools
+import time
 import structlog
-from typing import Optional
+from typing import Any, Awaitable, Callable, NamedTuple, Optional
 from redis.asyncio import Redis, ConnectionPool
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncEngine, AsyncSession, async_sessionmaker
 from sqlalchemy import text
@@ -26,6 +29,48 @@ from test_coordinator_data_adapter.adapters.stub import (
 logger = structlog.get_logger(__name__)
 
 
+class _RepositorySpec(NamedTuple):
+    """How to build a repository until its backend implementation exists."""
+
+    create_stub: Callable[[AdapterConfig], Any]
+    fallback_event: str
+    not_implemented_event: str
+
+
+_REPOSITORY_SPECS: dict[type, _RepositorySpec] = {
+    ScenariosRepository: _RepositorySpec(
+        lambda config: StubScenariosRepository(),
+        "scenarios_repository_fallback_to_stub",
+        "scenarios_repository_postgresql_not_implemented",
+    ),
+    TestRunsRepository: _RepositorySpec(
+        lambda config: StubTestRunsRepository(),
+        "test_runs_repository_fallback_to_stub",
+        "test_runs_repository_postgresql_not_implemented",
+    ),
+    ChaosEventsRepository: _RepositorySpec(
+        lambda config: StubChaosEventsRepository(),
+        "chaos_events_repository_fallback_to_stub",
+        "chaos_events_repository_postgresql_not_implemented",
+    ),
+    TestResultsRepository: _RepositorySpec(
+        lambda config: StubTestResultsRepository(),
+        "test_results_repository_fallback_to_stub",
+        "test_results_repository_postgresql_not_implemented",
+    ),
+    ServiceDiscoveryRepository: _RepositorySpec(
+        lambda config: StubServiceDiscoveryRepository(),
+        "service_discovery_repository_fallback_to_stub",
+        "service_discovery_repository_redis_not_implemented",
+    ),
+    CacheRepository: _RepositorySpec(
+        lambda config: StubCacheRepository(max_size=config.cache_max_entries),
+        "cache_repository_fallback_to_stub",
+        "cache_repository_redis_not_implemented",
+    ),
+}
+
+
 class AdapterFactory:
     """Factory for creating test coordinator data adapter repository instances."""
 
@@ -40,6 +85,8 @@ class AdapterFactory:
         self._session_maker: Optional[async_sessionmaker[AsyncSession]] = None
         self._redis_pool: Optional[ConnectionPool] = None
         self._redis_client: Optional[Redis] = None
+        # time.monotonic() deadline until which the last successful PostgreSQL probe holds
+        self._postgres_healthy_until = 0.0
         self._is_initialized = False
         logger.info(
             "adapter_factory_created",
@@ -48,8 +95,13 @@ class AdapterFactory:
         )
 
     @staticmethod
+    @functools.lru_cache(maxsize=16)
     def _mask_password(url: str) -> str:
-        """Mask password in URL for logging."""
+        """Mask password in URL for logging.
+
+        Results are cached, since the URLs come from configuration and are
+        masked again for every factory created.
+        """
         try:
             from urllib.parse import urlparse, urlunparse
 
@@ -135,6 +187,7 @@ class AdapterFactory:
                 logger.debug("postgres_engine_disposed")
 
             self._session_maker = None
+            self._postgres_healthy_until = 0.0
             self._is_initialized = False
             logger.info("factory_cleanup_complete")
 
@@ -145,37 +198,65 @@ class AdapterFactory:
     async def health_check(self) -> dict:
         """Check health of database and cache connections.
 
+        PostgreSQL and Redis are probed concurrently, each bounded by
+        health_check_timeout.
+
         Returns:
             Dictionary with health status of each component.
         """
+        postgres, redis = await asyncio.gather(self._check_postgres(), self._check_redis())
         health = {
             "factory_initialized": self._is_initialized,
-            "postgres": {"connected": False, "error": None},
-            "redis": {"connected": False, "error": None},
+            "postgres": postgres,
+            "redis": redis,
         }
-
-        # Check PostgreSQL connection
-        if self._postgres_engine:
-            try:
-                async with self._postgres_engine.connect() as conn:
-                    await conn.execute(text("SELECT 1"))
-                health["postgres"]["connected"] = True
-            except Exception as e:
-                health["postgres"]["error"] = str(e)
-                logger.warning("postgres_health_check_failed", error=str(e))
-
-        # Check Redis connection
-        if self._redis_client:
-            try:
-                await self._redis_client.ping()
-                health["redis"]["connected"] = True
-            except Exception as e:
-                health["redis"]["error"] = str(e)
-                logger.warning("redis_health_check_failed", error=str(e))
-
         logger.debug("health_check_completed", **health)
         return health
 
+    async def _check_postgres(self) -> dict:
+        """Check PostgreSQL connection with SELECT 1.
+
+        A successful check is reused for postgres_health_cache_seconds, so
+        frequent health probes do not check out a pool connection each time.
+        """
+        if not self._postgres_engine:
+            return {"connected": False, "error": None}
+        if time.monotonic() < self._postgres_healthy_until:
+            return {"connected": True, "error": None}
+        engine = self._postgres_engine
+
+        async def ping() -> None:
+            async with engine.connect() as conn:
+                await conn.execute(text("SELECT 1"))
+
+        status = await self._probe(ping, "postgres_health_check_failed")
+        if status["connected"]:
+            self._postgres_healthy_until = time.monotonic() + self.config.postgres_health_cache_seconds
+        else:
+            self._postgres_healthy_until = 0.0
+        return status
+
+    async def _check_redis(self) -> dict:
+        """Check Redis connection with PING."""
+        if not self._redis_client:
+            return {"connected": False, "error": None}
+        return await self._probe(self._redis_client.ping, "redis_health_check_failed")
+
+    async def _probe(self, ping: Callable[[], Awaitable], failure_event: str) -> dict:
+        """Run a connection probe under the health check timeout."""
+        status = {"connected": False, "error": None}
+        timeout = self.config.health_check_timeout
+        try:
+            await asyncio.wait_for(ping(), timeout=timeout)
+            status["connected"] = True
+        except TimeoutError:
+            status["error"] = f"timed out after {timeout}s"
+            logger.warning(failure_event, error=status["error"])
+        except Exception as e:
+            status["error"] = str(e)
+            logger.warning(failure_event, error=str(e))
+        return status
+
     def get_session_maker(self) -> Optional[async_sessionmaker[AsyncSession]]:
         """Get SQLAlchemy session maker.
 
@@ -194,6 +275,17 @@ class AdapterFactory:
 
     # Repository factory methods
 
+    def _get_repository(self, interface: type, use_stub: bool) -> Any:
+        """Create repository for interface, falling back to its stub implementation."""
+        spec = _REPOSITORY_SPECS[interface]
+        if not use_stub:
+            if not self._is_initialized:
+                logger.warning(spec.fallback_event, reason="factory_not_initialized")
+            else:
+                # TODO: Implement PostgreSQL and Redis repositories when ready
+                logger.warning(spec.not_implemented_event, fallback="stub")
+        return spec.create_stub(self.config)
+
     def get_scenarios_repository(self, use_stub: bool = False) -> ScenariosRepository:
         """Get scenarios repository.
 
@@ -204,14 +296,7 @@ class AdapterFactory:
         Returns:
             ScenariosRepository instance.
         """
-        if use_stub or not self._is_initialized:
-            if not use_stub and not self._is_initialized:
-                logger.warning("scenarios_repository_fallback_to_stub", reason="factory_not_initialized")
-            return StubScenariosRepository()
-
-        # TODO: Implement PostgreSQL repository when ready
-        logger.warning("scenarios_repository_postgresql_not_implemented", fallback="stub")
-        return StubScenariosRepository()
+        return self._get_repository(ScenariosRepository, use_stub)
 
     def get_test_runs_repository(self, use_stub: bool = False) -> TestRunsRepository:
         """Get test runs repository.
@@ -223,14 +308,7 @@ class AdapterFactory:
         Returns:
             TestRunsRepository instance.
         """
-        if use_stub or not self._is_initialized:
-            if not use_stub and not self._is_initialized:
-                logger.warning("test_runs_repository_fallback_to_stub", reason="factory_not_initialized")
-            return StubTestRunsRepository()
-
-        # TODO: Implement PostgreSQL repository when ready
-        logger.warning("test_runs_repository_postgresql_not_implemented", fallback="stub")
-        return StubTestRunsRepository()
+        return self._get_repository(TestRunsRepository, use_stub)
 
     def get_chaos_events_repository(self, use_stub: bool = False) -> ChaosEventsRepository:
         """Get chaos events repository.
@@ -242,14 +320,7 @@ class AdapterFactory:
         Returns:
             ChaosEventsRepository instance.
         """
-        if use_stub or not self._is_initialized:
-            if not use_stub and not self._is_initialized:
-                logger.warning("chaos_events_repository_fallback_to_stub", reason="factory_not_initialized")
-            return StubChaosEventsRepository()
-
-        # TODO: Implement PostgreSQL repository when ready
-        logger.warning("chaos_events_repository_postgresql_not_implemented", fallback="stub")
-        return StubChaosEventsRepository()
+        return self._get_repository(ChaosEventsRepository, use_stub)
 
     def get_test_results_repository(self, use_stub: bool = False) -> TestResultsRepository:
         """Get test results repository.
@@ -261,14 +332,7 @@ class AdapterFactory:
         Returns:
             TestResultsRepository instance.
         """
-        if use_stub or not self._is_initialized:
-            if not use_stub and not self._is_initialized:
-                logger.warning("test_results_repository_fallback_to_stub", reason="factory_not_initialized")
-            return StubTestResultsRepository()
-
-        # TODO: Implement PostgreSQL repository when ready
-        logger.warning("test_results_repository_postgresql_not_implemented", fallback="stub")
-        return StubTestResultsRepository()
+        return self._get_repository(TestResultsRepository, use_stub)
 
     def get_service_discovery_repository(self, use_stub: bool = False) -> ServiceDiscoveryRepository:
         """Get service discovery repository.
@@ -280,14 +344,7 @@ class AdapterFactory:
         Returns:
             ServiceDiscoveryRepository instance.
         """
-        if use_stub or not self._is_initialized:
-            if not use_stub and not self._is_initialized:
-                logger.warning("service_discovery_repository_fallback_to_stub", reason="factory_not_initialized")
-            return StubServiceDiscoveryRepository()
-
-        # TODO: Implement Redis repository when ready
-        logger.warning("service_discovery_repository_redis_not_implemented", fallback="stub")
-        return StubServiceDiscoveryRepository()
+        return self._get_repository(ServiceDiscoveryRepository, use_stub)
 
     def get_cache_repository(self, use_stub: bool = False) -> CacheRepository:
         """Get cache repository.
@@ -299,14 +356,7 @@ class AdapterFactory:
         Returns:
             CacheRepository instance.
         """
-        if use_stub or not self._is_initialized:
-            if not use_stub and not self._is_initialized:
-                logger.warning("cache_repository_fallback_to_stub", reason="factory_not_initialized")
-            return StubCacheRepository()
-
-        # TODO: Implement Redis repository when ready
-        logger.warning("cache_repository_redis_not_implemented", fallback="stub")
-        return StubCacheRepository()
+        return self._get_repository(CacheRepository, use_stub)
 
     async def __aenter__(self):
         """Async context manager entry."""
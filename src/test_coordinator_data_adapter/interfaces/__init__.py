@@ -1,4 +1,9 @@
-"""Repository interfaces for test coordinator data adapter."""
+"""Repository interfaces for test coordinator data adapter.
+
+Implementations build models read back from their own storage with
+``from_trusted``, which skips validation; data arriving from callers is
+validated by the models as usual.
+"""
 
 from test_coordinator_data_adapter.interfaces.scenarios import ScenariosRepository
 from test_coordinator_data_adapter.interfaces.test_runs import TestRunsRepository
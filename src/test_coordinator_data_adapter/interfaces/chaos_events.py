@@ -56,3 +56,8 @@ class ChaosEventsRepository(ABC):
     async def calculate_average_recovery_time(self, event_type: EventType) -> float:
         """Calculate average recovery time for event type."""
         pass
+
+    @abstractmethod
+    async def bulk_create(self, events: List[ChaosEvent]) -> List[ChaosEvent]:
+        """Bulk create chaos events."""
+        pass
@@ -56,3 +56,8 @@ class ScenariosRepository(ABC):
     async def get_active_scenarios(self) -> List[Scenario]:
         """Get all active scenarios."""
         pass
+
+    @abstractmethod
+    async def bulk_create(self, scenarios: List[Scenario]) -> List[Scenario]:
+        """Bulk create scenarios."""
+        pass
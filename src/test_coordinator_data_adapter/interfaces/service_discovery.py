@@ -1,12 +1,16 @@
 """Service discovery repository interface."""
 from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import List, Optional
-from pydantic import BaseModel, Field
+from typing import ClassVar, Dict, List, Optional
+from pydantic import Field
 
+from test_coordinator_data_adapter.models.base import DomainModel, JsonObject
 
-class ServiceInfo(BaseModel):
+
+class ServiceInfo(DomainModel):
     """Service registration information."""
+    id_field: ClassVar[str] = "service_id"
+
     service_id: str = Field(..., description="Unique service identifier")
     service_name: str = Field(..., description="Service name")
     version: str = Field(..., description="Service version")
@@ -15,7 +19,7 @@ class ServiceInfo(BaseModel):
     http_port: int = Field(..., description="HTTP port")
     last_seen: datetime = Field(..., description="Last heartbeat timestamp")
     registered_at: datetime = Field(..., description="Registration timestamp")
-    metadata: dict = Field(default_factory=dict, description="Additional metadata")
+    metadata: JsonObject = Field(default_factory=dict, description="Additional metadata")
 
 
 class ServiceDiscoveryRepository(ABC):
@@ -36,6 +40,11 @@ class ServiceDiscoveryRepository(ABC):
         """Get service by ID."""
         pass
 
+    @abstractmethod
+    async def get_many_by_ids(self, service_ids: List[str]) -> Dict[str, ServiceInfo]:
+        """Get services by ID, omitting missing IDs."""
+        pass
+
     @abstractmethod
     async def get_service_by_name(self, service_name: str) -> Optional[ServiceInfo]:
         """Get service by name (returns first matching)."""
@@ -51,6 +60,16 @@ class ServiceDiscoveryRepository(ABC):
         """List all registered services."""
         pass
 
+    @abstractmethod
+    async def list_all_services_columns(self, columns: tuple[str, ...]) -> Dict[str, list]:
+        """List selected fields of all registered services as parallel lists.
+
+        Returns one list per requested ServiceInfo field, all in the same
+        service order, so status pages read only the columns they need without
+        building a ServiceInfo per service. Raises ValueError for unknown fields.
+        """
+        pass
+
     @abstractmethod
     async def update_heartbeat(self, service_id: str) -> ServiceInfo:
         """Update service heartbeat timestamp."""
@@ -63,10 +82,15 @@ class ServiceDiscoveryRepository(ABC):
 
     @abstractmethod
     async def is_service_healthy(self, service_id: str, threshold_seconds: int) -> bool:
-        """Check if service is healthy based on last heartbeat."""
+        """Check if service is healthy, i.e. its last heartbeat is within threshold_seconds."""
         pass
 
     @abstractmethod
     async def get_service_count(self) -> int:
         """Get total count of registered services."""
         pass
+
+    @abstractmethod
+    async def bulk_register(self, services: List[ServiceInfo]) -> List[ServiceInfo]:
+        """Register multiple services."""
+        pass
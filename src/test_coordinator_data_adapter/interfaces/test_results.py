@@ -1,6 +1,6 @@
 """Test results repository interface."""
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Dict, List, Optional
 from test_coordinator_data_adapter.models import TestResult, ResultStatus, AssertionType
 
 
@@ -52,6 +52,14 @@ class TestResultsRepository(ABC):
         """Count results by status for a run."""
         pass
 
+    @abstractmethod
+    async def get_status_counts(self, run_id: str) -> Dict[ResultStatus, int]:
+        """Get a mapping from each status to its result count for a run.
+
+        Statuses with no results are omitted.
+        """
+        pass
+
     @abstractmethod
     async def get_assertion_statistics(self, assertion_type: AssertionType) -> dict:
         """Get statistics for an assertion type."""
@@ -59,5 +67,9 @@ class TestResultsRepository(ABC):
 
     @abstractmethod
     async def bulk_create(self, results: List[TestResult]) -> List[TestResult]:
-        """Bulk create test results."""
+        """Bulk create test results.
+
+        Implementations should write the batch in as few round trips as
+        possible rather than one insert per result.
+        """
         pass
@@ -1,7 +1,7 @@
 """Test runs repository interface."""
 from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import List, Optional
+from typing import Dict, List, Optional
 from test_coordinator_data_adapter.models import TestRun, RunStatus
 
 
@@ -18,6 +18,11 @@ class TestRunsRepository(ABC):
         """Get test run by ID."""
         pass
 
+    @abstractmethod
+    async def get_many_by_ids(self, run_ids: List[str]) -> Dict[str, TestRun]:
+        """Get test runs by ID, omitting missing IDs."""
+        pass
+
     @abstractmethod
     async def update(self, test_run: TestRun) -> TestRun:
         """Update existing test run."""
@@ -38,6 +43,16 @@ class TestRunsRepository(ABC):
         """Get runs by status."""
         pass
 
+    @abstractmethod
+    async def count_by_scenario(self, scenario_id: str) -> int:
+        """Count runs for a scenario."""
+        pass
+
+    @abstractmethod
+    async def count_by_status(self, status: RunStatus) -> int:
+        """Count runs by status."""
+        pass
+
     @abstractmethod
     async def update_status(self, run_id: str, status: RunStatus) -> TestRun:
         """Update run status."""
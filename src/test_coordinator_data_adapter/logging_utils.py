@@ -0,0 +1,18 @@
+"""Logging helpers for test coordinator data adapter."""
+import logging
+from typing import Any
+
+
+def is_debug_enabled(logger: Any) -> bool:
+    """Check if logger emits debug events under the current structlog configuration.
+
+    Filtering bound loggers expose ``is_enabled_for`` and stdlib-backed loggers
+    expose ``isEnabledFor``. Any other wrapper class is assumed to emit debug.
+    """
+    bound = logger.bind()
+    is_enabled_for = getattr(bound, "is_enabled_for", None) or getattr(
+        bound, "isEnabledFor", None
+    )
+    if is_enabled_for is None:
+        return True
+    return bool(is_enabled_for(logging.DEBUG))
@@ -1,5 +1,7 @@
 """Domain models for test coordinator data adapter."""
 
+from test_coordinator_data_adapter.models.base import DomainModel
+
 from test_coordinator_data_adapter.models.scenario import (
     Scenario,
     ScenarioStatus,
@@ -11,6 +13,7 @@ from test_coordinator_data_adapter.models.test_run import (
 )
 from test_coordinator_data_adapter.models.chaos_event import (
     ChaosEvent,
+    ChaosParameters,
     EventType,
     EventStatus,
 )
@@ -19,17 +22,21 @@ from test_coordinator_data_adapter.models.test_result import (
     ResultStatus,
     AssertionType,
 )
+from test_coordinator_data_adapter.models.audit import AuditRecord
 
 __all__ = [
+    "DomainModel",
     "Scenario",
     "ScenarioStatus",
     "ScenarioType",
     "TestRun",
     "RunStatus",
     "ChaosEvent",
+    "ChaosParameters",
     "EventType",
     "EventStatus",
     "TestResult",
     "ResultStatus",
     "AssertionType",
+    "AuditRecord",
 ]
@@ -0,0 +1,12 @@
+"""Audit record union - records sharing an audit correlation ID."""
+from typing import Annotated, Union
+
+from pydantic import Field
+
+from test_coordinator_data_adapter.models.chaos_event import ChaosEvent
+from test_coordinator_data_adapter.models.test_result import TestResult
+from test_coordinator_data_adapter.models.test_run import TestRun
+
+# Tagged on each model's kind field, so validation selects the model with one
+# lookup instead of trying each member in turn.
+AuditRecord = Annotated[Union[TestRun, ChaosEvent, TestResult], Field(discriminator="kind")]
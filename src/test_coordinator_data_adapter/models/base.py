@@ -0,0 +1,110 @@
+"""Base class for domain models."""
+import functools
+from datetime import datetime, UTC
+from enum import Enum
+from types import UnionType
+from typing import Any, Callable, ClassVar, Iterable, Mapping, Self, Union, get_args, get_origin
+
+from pydantic import BaseModel, ConfigDict, InstanceOf, TypeAdapter
+
+# Free-form JSON object field. Validation only checks the value is a dict and
+# stores it as given, instead of walking and copying every nested value.
+JsonObject = InstanceOf[dict]
+
+# Timestamp default_factory; a partial avoids a lambda frame per instantiation.
+utcnow = functools.partial(datetime.now, UTC)
+
+
+class DomainModel(BaseModel):
+    """Base for domain models, adding construction from trusted data.
+
+    Models are frozen; change one with model_copy(update=...). Validators are
+    built on first use rather than at import. Instances are entities: equality
+    and hashing use only the id_field, not the full field set.
+    """
+
+    id_field: ClassVar[str]
+
+    model_config = ConfigDict(
+        frozen=True, extra="ignore", revalidate_instances="never", defer_build=True
+    )
+
+    def __eq__(self, other: object) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        id_field = self.id_field
+        return getattr(self, id_field) == getattr(other, id_field)
+
+    def __hash__(self) -> int:
+        return hash((type(self), getattr(self, self.id_field)))
+
+    @classmethod
+    def from_trusted(cls, data: Mapping[str, Any]) -> Self:
+        """Build model from data known to be valid, skipping validation.
+
+        For rows read back from the adapter's own storage; inbound data from
+        callers goes through model_validate. Enum values and ISO datetime
+        strings are converted, everything else is used as-is.
+        """
+        values = dict(data)
+        for name, convert in _string_converters(cls).items():
+            value = values.get(name)
+            if type(value) is str:
+                values[name] = convert(value)
+        return cls.model_construct(_fields_set=set(values), **values)
+
+    @classmethod
+    def row_columns(cls) -> tuple[str, ...]:
+        """Get the column names matching to_row() values."""
+        return _row_columns(cls)
+
+    def to_row(self) -> tuple:
+        """Get field values in row_columns() order for COPY or executemany.
+
+        Enums are reduced to their values; other values, including datetimes
+        and JSON objects, are passed through for the driver to encode.
+        """
+        values = self.__dict__
+        return tuple(
+            value.value if isinstance(value := values[name], Enum) else value
+            for name in _row_columns(type(self))
+        )
+
+    @classmethod
+    def validate_many(cls, rows: Iterable[Any]) -> list[Self]:
+        """Validate a batch of mappings or models in one call."""
+        return _list_adapter(cls).validate_python(rows)
+
+    @classmethod
+    def validate_many_json(cls, payload: str | bytes) -> list[Self]:
+        """Validate a JSON array of models in one pass through pydantic-core's parser."""
+        return _list_adapter(cls).validate_json(payload)
+
+
+@functools.cache
+def _list_adapter(model: type[BaseModel]) -> TypeAdapter:
+    """Get the shared list[model] adapter, building it on first use."""
+    return TypeAdapter(list[model])
+
+
+@functools.cache
+def _row_columns(model: type[BaseModel]) -> tuple[str, ...]:
+    """Get model's storage columns: its fields, minus the kind discriminator."""
+    return tuple(name for name in model.model_fields if name != "kind")
+
+
+@functools.cache
+def _string_converters(model: type[BaseModel]) -> dict[str, Callable[[str], Any]]:
+    """Map model's enum and datetime fields to converters from their string form."""
+    converters: dict[str, Callable[[str], Any]] = {}
+    for name, field in model.model_fields.items():
+        annotation = field.annotation
+        if get_origin(annotation) in (Union, UnionType):
+            # Optional[X] -> X
+            args = [a for a in get_args(annotation) if a is not type(None)]
+            annotation = args[0] if len(args) == 1 else None
+        if isinstance(annotation, type) and issubclass(annotation, Enum):
+            converters[name] = annotation
+        elif annotation is datetime:
+            converters[name] = datetime.fromisoformat
+    return converters
@@ -1,9 +1,11 @@
 """ChaosEvent domain model - chaos injection tracking."""
-from datetime import datetime, UTC
+from datetime import datetime
 from enum import Enum
-from typing import Optional, Dict, Any
+from typing import ClassVar, Literal, Optional, TypedDict
 
-from pydantic import BaseModel, Field
+from pydantic import ConfigDict, Field
+
+from test_coordinator_data_adapter.models.base import DomainModel, JsonObject, utcnow
 
 
 class EventType(str, Enum):
@@ -28,16 +30,43 @@ class EventStatus(str, Enum):
     FAILED = "failed"
 
 
-class ChaosEvent(BaseModel):
+class ChaosParameters(TypedDict, total=False):
+    """Well-known chaos event parameters, for typing the dicts passed as ChaosEvent.parameters.
+
+    The field itself stays a free-form dict: events may carry other keys, and
+    values are stored without per-key validation.
+    """
+    graceful: bool
+    delay_seconds: int
+    latency_ms: int
+    partition_type: str
+    isolated_services: list[str]
+
+
+_EXAMPLE = {
+    "event_id": "chaos_001",
+    "run_id": "run_001",
+    "event_type": "service_restart",
+    "target_service": "trading-engine",
+    "parameters": {"graceful": True, "delay_seconds": 5},
+    "injected_at": "2025-10-06T10:01:00Z",
+    "status": "recovered",
+    "recovery_time_ms": 2500,
+}
+
+
+class ChaosEvent(DomainModel):
     """Chaos injection event with recovery metrics."""
 
+    id_field: ClassVar[str] = "event_id"
+
     event_id: str = Field(..., description="Unique chaos event identifier")
     run_id: str = Field(..., description="Test run this event belongs to")
 
     # Event details
     event_type: EventType = Field(..., description="Type of chaos being injected")
     target_service: str = Field(..., description="Service being targeted by chaos")
-    parameters: Dict[str, Any] = Field(..., description="Chaos event parameters")
+    parameters: JsonObject = Field(..., description="Chaos event parameters")
 
     # Timing
     injected_at: datetime = Field(..., description="When chaos was injected")
@@ -48,15 +77,7 @@ class ChaosEvent(BaseModel):
     recovery_time_ms: Optional[int] = Field(None, description="Time to recover from chaos")
 
     # Audit
-    created_at: datetime = Field(default_factory=lambda: datetime.now(UTC))
-
-    model_config = {"json_schema_extra": {"example": {
-        "event_id": "chaos_001",
-        "run_id": "run_001",
-        "event_type": "service_restart",
-        "target_service": "trading-engine",
-        "parameters": {"graceful": True, "delay_seconds": 5},
-        "injected_at": "2025-10-06T10:01:00Z",
-        "status": "recovered",
-        "recovery_time_ms": 2500
-    }}}
+    created_at: datetime = Field(default_factory=utcnow)
+    kind: Literal["event"] = Field("event", description="Record type discriminator for AuditRecord")
+
+    model_config = ConfigDict(json_schema_extra={"example": _EXAMPLE})
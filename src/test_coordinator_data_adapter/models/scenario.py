@@ -1,9 +1,11 @@
 """Scenario domain model - test scenario definitions."""
-from datetime import datetime, UTC
+from datetime import datetime
 from enum import Enum
-from typing import Optional, Dict, Any, List
+from typing import ClassVar, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import ConfigDict, Field
+
+from test_coordinator_data_adapter.models.base import DomainModel, JsonObject, utcnow
 
 
 class ScenarioType(str, Enum):
@@ -24,9 +26,24 @@ class ScenarioStatus(str, Enum):
     DEPRECATED = "deprecated"
 
 
-class Scenario(BaseModel):
+_EXAMPLE = {
+    "scenario_id": "scen_001",
+    "name": "Trading Engine Restart Test",
+    "description": "Validates system behavior during trading engine restart",
+    "scenario_type": "service_restart",
+    "status": "active",
+    "configuration": {"target_service": "trading-engine", "graceful": True},
+    "services_under_test": ["trading-engine", "risk-monitor"],
+    "expected_outcomes": ["service_recovers", "no_data_loss"],
+    "created_by": "test_engineer",
+}
+
+
+class Scenario(DomainModel):
     """Test scenario definition with YAML configuration."""
 
+    id_field: ClassVar[str] = "scenario_id"
+
     scenario_id: str = Field(..., description="Unique scenario identifier")
     name: str = Field(..., description="Human-readable scenario name")
     description: Optional[str] = Field(None, description="Detailed scenario description")
@@ -36,24 +53,14 @@ class Scenario(BaseModel):
     status: ScenarioStatus = Field(default=ScenarioStatus.DRAFT, description="Scenario status")
 
     # Configuration
-    configuration: Dict[str, Any] = Field(..., description="YAML/JSON scenario configuration")
-    services_under_test: List[str] = Field(default_factory=list, description="Services being tested")
-    expected_outcomes: List[str] = Field(default_factory=list, description="Expected scenario outcomes")
+    configuration: JsonObject = Field(..., description="YAML/JSON scenario configuration")
+    services_under_test: tuple[str, ...] = Field(default=(), description="Services being tested")
+    expected_outcomes: tuple[str, ...] = Field(default=(), description="Expected scenario outcomes")
 
     # Metadata
     created_by: Optional[str] = Field(None, description="User who created scenario")
-    created_at: datetime = Field(default_factory=lambda: datetime.now(UTC))
-    updated_at: datetime = Field(default_factory=lambda: datetime.now(UTC))
-    tags: List[str] = Field(default_factory=list, description="Scenario tags for categorization")
-
-    model_config = {"json_schema_extra": {"example": {
-        "scenario_id": "scen_001",
-        "name": "Trading Engine Restart Test",
-        "description": "Validates system behavior during trading engine restart",
-        "scenario_type": "service_restart",
-        "status": "active",
-        "configuration": {"target_service": "trading-engine", "graceful": True},
-        "services_under_test": ["trading-engine", "risk-monitor"],
-        "expected_outcomes": ["service_recovers", "no_data_loss"],
-        "created_by": "test_engineer"
-    }}}
+    created_at: datetime = Field(default_factory=utcnow)
+    updated_at: datetime = Field(default_factory=utcnow)
+    tags: tuple[str, ...] = Field(default=(), description="Scenario tags for categorization")
+
+    model_config = ConfigDict(json_schema_extra={"example": _EXAMPLE})
@@ -1,9 +1,11 @@
 """TestResult domain model - test assertion results."""
-from datetime import datetime, UTC
+from datetime import datetime
 from enum import Enum
-from typing import Optional
+from typing import ClassVar, Literal, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import ConfigDict, Field
+
+from test_coordinator_data_adapter.models.base import DomainModel, utcnow
 
 
 class AssertionType(str, Enum):
@@ -27,9 +29,23 @@ class ResultStatus(str, Enum):
     ERROR = "error"
 
 
-class TestResult(BaseModel):
+_EXAMPLE = {
+    "result_id": "result_001",
+    "run_id": "run_001",
+    "assertion_type": "service_health",
+    "expected_value": "healthy",
+    "actual_value": "healthy",
+    "status": "passed",
+    "verification_time": "2025-10-06T10:05:00Z",
+    "correlation_id": "audit_trace_123",
+}
+
+
+class TestResult(DomainModel):
     """Test assertion result with verification details."""
 
+    id_field: ClassVar[str] = "result_id"
+
     result_id: str = Field(..., description="Unique result identifier")
     run_id: str = Field(..., description="Test run this result belongs to")
 
@@ -49,15 +65,7 @@ class TestResult(BaseModel):
     correlation_id: Optional[str] = Field(None, description="Correlation ID linking to audit trail")
 
     # Audit
-    created_at: datetime = Field(default_factory=lambda: datetime.now(UTC))
-
-    model_config = {"json_schema_extra": {"example": {
-        "result_id": "result_001",
-        "run_id": "run_001",
-        "assertion_type": "service_health",
-        "expected_value": "healthy",
-        "actual_value": "healthy",
-        "status": "passed",
-        "verification_time": "2025-10-06T10:05:00Z",
-        "correlation_id": "audit_trace_123"
-    }}}
+    created_at: datetime = Field(default_factory=utcnow)
+    kind: Literal["result"] = Field("result", description="Record type discriminator for AuditRecord")
+
+    model_config = ConfigDict(json_schema_extra={"example": _EXAMPLE})
@@ -1,9 +1,11 @@
 """TestRun domain model - test execution tracking."""
-from datetime import datetime, UTC
+from datetime import datetime
 from enum import Enum
-from typing import Optional, Dict, Any
+from typing import ClassVar, Literal, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import ConfigDict, Field
+
+from test_coordinator_data_adapter.models.base import DomainModel, JsonObject, utcnow
 
 
 class RunStatus(str, Enum):
@@ -17,9 +19,23 @@ class RunStatus(str, Enum):
     TIMEOUT = "timeout"
 
 
-class TestRun(BaseModel):
+_EXAMPLE = {
+    "run_id": "run_001",
+    "scenario_id": "scen_001",
+    "status": "passed",
+    "started_at": "2025-10-06T10:00:00Z",
+    "completed_at": "2025-10-06T10:05:00Z",
+    "duration_ms": 300000,
+    "configuration_snapshot": {"version": "1.0"},
+    "exit_code": 0,
+}
+
+
+class TestRun(DomainModel):
     """Test execution run with results and metrics."""
 
+    id_field: ClassVar[str] = "run_id"
+
     run_id: str = Field(..., description="Unique test run identifier")
     scenario_id: str = Field(..., description="Scenario being executed")
 
@@ -32,7 +48,7 @@ class TestRun(BaseModel):
     duration_ms: Optional[int] = Field(None, description="Total execution duration in milliseconds")
 
     # Configuration
-    configuration_snapshot: Dict[str, Any] = Field(..., description="Snapshot of scenario config at runtime")
+    configuration_snapshot: JsonObject = Field(..., description="Snapshot of scenario config at runtime")
     test_environment: Optional[str] = Field(None, description="Environment where test ran (dev/staging/prod)")
 
     # Results
@@ -40,16 +56,8 @@ class TestRun(BaseModel):
     error_message: Optional[str] = Field(None, description="Error message if run failed")
 
     # Audit
-    created_at: datetime = Field(default_factory=lambda: datetime.now(UTC))
-    updated_at: datetime = Field(default_factory=lambda: datetime.now(UTC))
-
-    model_config = {"json_schema_extra": {"example": {
-        "run_id": "run_001",
-        "scenario_id": "scen_001",
-        "status": "passed",
-        "started_at": "2025-10-06T10:00:00Z",
-        "completed_at": "2025-10-06T10:05:00Z",
-        "duration_ms": 300000,
-        "configuration_snapshot": {"version": "1.0"},
-        "exit_code": 0
-    }}}
+    created_at: datetime = Field(default_factory=utcnow)
+    updated_at: datetime = Field(default_factory=utcnow)
+    kind: Literal["run"] = Field("run", description="Record type discriminator for AuditRecord")
+
+    model_config = ConfigDict(json_schema_extra={"example": _EXAMPLE})
@@ -0,0 +1,92 @@
+"""Shared fixtures for unit tests.
+
+Every run reports its ten slowest tests (--durations=10). While iterating,
+``pytest --lf`` reruns only the last failures and ``pytest --sw`` stops at the
+first failure and resumes from it next run; ``-m "not slow"`` skips tests
+marked slow.
+
+Large runs can be spread over CPUs with ``pytest -n auto --dist loadfile``
+(pytest-xdist). Each worker is its own process, so session- and
+module-scoped fixtures are built once per worker and never shared.
+"""
+import pytest
+from datetime import datetime, UTC
+from test_coordinator_data_adapter.adapters.stub import (
+    StubScenariosRepository,
+    StubTestRunsRepository,
+    StubChaosEventsRepository,
+    StubTestResultsRepository,
+    StubServiceDiscoveryRepository,
+    StubCacheRepository,
+)
+from test_coordinator_data_adapter.interfaces import ServiceInfo
+from test_coordinator_data_adapter.models import Scenario, TestRun, ChaosEvent, TestResult
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _build_model_validators():
+    """Build deferred model validators once, so the first test using a model doesn't pay for it."""
+    for model in (Scenario, TestRun, ChaosEvent, TestResult, ServiceInfo):
+        model.model_rebuild(force=True)
+
+
+@pytest.fixture
+def now():
+    """Current UTC time, taken when the test starts."""
+    return datetime.now(UTC)
+
+
+@pytest.fixture
+def make_service(now):
+    """Factory for known-good ServiceInfo records, built without validation."""
+
+    def _make(service_id: str, **overrides) -> ServiceInfo:
+        fields = {
+            "service_name": "trading-engine",
+            "version": "1.0.0",
+            "host": "localhost",
+            "grpc_port": 50051,
+            "http_port": 8080,
+            "last_seen": now,
+            "registered_at": now,
+            **overrides,
+        }
+        return ServiceInfo.model_construct(service_id=service_id, **fields)
+
+    return _make
+
+
+@pytest.fixture
+def scenarios_repo():
+    """Empty stub scenarios repository."""
+    return StubScenariosRepository()
+
+
+@pytest.fixture
+def test_runs_repo():
+    """Empty stub test runs repository."""
+    return StubTestRunsRepository()
+
+
+@pytest.fixture
+def chaos_events_repo():
+    """Empty stub chaos events repository."""
+    return StubChaosEventsRepository()
+
+
+@pytest.fixture
+def test_results_repo():
+    """Empty stub test results repository."""
+    return StubTestResultsRepository()
+
+
+@pytest.fixture
+def service_discovery_repo():
+    """Empty stub service discovery repository."""
+    return StubServiceDiscoveryRepository()
+
+
+@pytest.fixture
+def cache_repo():
+    """Empty stub cache repository."""
+    return StubCacheRepository()
@@ -1,5 +1,5 @@
 """Unit tests for adapter factory."""
-import pytest
+import asyncio
 from test_coordinator_data_adapter.factory import AdapterFactory
 from test_coordinator_data_adapter.config import AdapterConfig
 from test_coordinator_data_adapter.adapters.stub import (
@@ -12,7 +12,6 @@ from test_coordinator_data_adapter.adapters.stub import (
 )
 
 
-@pytest.mark.asyncio
 class TestAdapterFactory:
     """Test adapter factory functionality."""
 
@@ -133,6 +132,61 @@ class TestAdapterFactory:
         assert health["postgres"]["connected"] is False
         assert health["redis"]["connected"] is False
 
+    async def test_health_check_times_out_slow_probe(self):
+        """GIVEN a Redis client whose ping never answers
+        WHEN performing health check
+        THEN the probe is reported as timed out instead of hanging."""
+        # Given
+        class HangingRedis:
+            async def ping(self):
+                await asyncio.sleep(3600)
+
+        factory = AdapterFactory(AdapterConfig(health_check_timeout=0))
+        factory._redis_client = HangingRedis()
+
+        # When
+        health = await factory.health_check()
+
+        # Then
+        assert health["redis"]["connected"] is False
+        assert "timed out" in health["redis"]["error"]
+        assert health["postgres"] == {"connected": False, "error": None}
+
+    async def test_health_check_reuses_recent_postgres_probe(self):
+        """GIVEN a PostgreSQL engine that answers SELECT 1
+        WHEN performing health checks back to back
+        THEN only the first check opens a connection."""
+        # Given
+        class FakeConnection:
+            async def __aenter__(self):
+                return self
+
+            async def __aexit__(self, *exc_info):
+                return False
+
+            async def execute(self, statement):
+                return None
+
+        class FakeEngine:
+            connects = 0
+
+            def connect(self):
+                self.connects += 1
+                return FakeConnection()
+
+        factory = AdapterFactory(AdapterConfig(postgres_health_cache_seconds=60))
+        engine = FakeEngine()
+        factory._postgres_engine = engine
+
+        # When
+        first = await factory.health_check()
+        second = await factory.health_check()
+
+        # Then
+        assert first["postgres"] == {"connected": True, "error": None}
+        assert second["postgres"] == {"connected": True, "error": None}
+        assert engine.connects == 1
+
     async def test_get_session_maker_when_not_initialized(self):
         """GIVEN an uninitialized factory
         WHEN getting session maker
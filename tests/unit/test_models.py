@@ -9,7 +9,7 @@ These tests WILL FAIL until models are implemented (TDD Red Phase).
 """
 import pytest
 from datetime import datetime, UTC
-from decimal import Decimal
+from pydantic import TypeAdapter
 
 # Models will be implemented in TDD GREEN phase
 from test_coordinator_data_adapter.models import (
@@ -19,13 +19,17 @@ from test_coordinator_data_adapter.models import (
     TestRun,
     RunStatus,
     ChaosEvent,
+    ChaosParameters,
     EventType,
     EventStatus,
     TestResult,
     ResultStatus,
     AssertionType,
+    AuditRecord,
 )
 
+_NOW = datetime(2025, 10, 6, 10, 0, tzinfo=UTC)
+
 
 class TestScenarioModel:
     """GIVEN scenario data
@@ -33,58 +37,68 @@ class TestScenarioModel:
     THEN model should validate and store data correctly
     """
 
-    def test_scenario_creation_with_all_fields(self):
-        """GIVEN complete scenario data
+    @pytest.mark.parametrize(
+        "fields, defaults",
+        [
+            pytest.param(
+                {
+                    "scenario_id": "scen_001",
+                    "name": "Basic Service Restart Test",
+                    "description": "Tests system behavior when a service restarts",
+                    "scenario_type": ScenarioType.SERVICE_RESTART,
+                    "configuration": {"target_service": "trading-engine", "delay_seconds": 5},
+                    "services_under_test": ("trading-engine", "risk-monitor"),
+                    "expected_outcomes": ("service_recovers", "no_data_loss"),
+                    "status": ScenarioStatus.ACTIVE,
+                    "created_by": "test_engineer",
+                },
+                {},
+                id="all_fields",
+            ),
+            pytest.param(
+                {
+                    "scenario_id": "scen_002",
+                    "name": "Minimal Test",
+                    "scenario_type": ScenarioType.NETWORK_PARTITION,
+                    "configuration": {},
+                },
+                {"status": ScenarioStatus.DRAFT, "services_under_test": (), "tags": ()},
+                id="minimal_fields",
+            ),
+        ],
+    )
+    def test_scenario_creation(self, fields, defaults):
+        """GIVEN scenario data
         WHEN creating Scenario
-        THEN all fields should be populated correctly
+        THEN given fields are stored and omitted fields take their defaults
         """
-        scenario = Scenario(
-            scenario_id="scen_001",
-            name="Basic Service Restart Test",
-            description="Tests system behavior when a service restarts",
-            scenario_type=ScenarioType.SERVICE_RESTART,
-            configuration={"target_service": "trading-engine", "delay_seconds": 5},
-            services_under_test=["trading-engine", "risk-monitor"],
-            expected_outcomes=["service_recovers", "no_data_loss"],
-            status=ScenarioStatus.ACTIVE,
-            created_by="test_engineer",
-        )
+        scenario = Scenario(**fields)
 
-        assert scenario.scenario_id == "scen_001"
-        assert scenario.name == "Basic Service Restart Test"
-        assert scenario.scenario_type == ScenarioType.SERVICE_RESTART
-        assert scenario.status == ScenarioStatus.ACTIVE
-        assert "target_service" in scenario.configuration
-        assert len(scenario.services_under_test) == 2
+        expected = {**fields, **defaults}
+        assert {name: getattr(scenario, name) for name in expected} == expected
+        assert scenario.created_at is not None
 
-    def test_scenario_with_minimal_fields(self):
-        """GIVEN minimal scenario data
+    def test_scenario_configuration_kept_as_given(self):
+        """GIVEN a nested configuration dict
         WHEN creating Scenario
-        THEN defaults should be applied
+        THEN the dict is stored as given and non-dict values are rejected
         """
+        configuration = {"target_service": "trading-engine", "steps": [{"delay_seconds": 5}]}
+
         scenario = Scenario(
-            scenario_id="scen_002",
-            name="Minimal Test",
-            scenario_type=ScenarioType.NETWORK_PARTITION,
-            configuration={},
+            scenario_id="scen_001",
+            name="Nested Config",
+            scenario_type=ScenarioType.SERVICE_RESTART,
+            configuration=configuration,
         )
 
-        assert scenario.scenario_id == "scen_002"
-        assert scenario.status == ScenarioStatus.DRAFT  # default
-        assert scenario.services_under_test == []  # default
-        assert scenario.created_at is not None
-
-    def test_scenario_type_enum_validation(self):
-        """GIVEN invalid scenario type
-        WHEN creating Scenario
-        THEN validation error should be raised
-        """
+        assert scenario.configuration is configuration
         with pytest.raises(ValueError):
             Scenario(
-                scenario_id="scen_003",
-                name="Invalid Type Test",
-                scenario_type="invalid_type",  # type: ignore
-                configuration={},
+                scenario_id="scen_002",
+                name="Bad Config",
+                scenario_type=ScenarioType.SERVICE_RESTART,
+                configuration=["not", "a", "dict"],
             )
 
 
@@ -94,217 +108,437 @@ class TestTestRunModel:
     THEN model should track execution lifecycle
     """
 
-    def test_test_run_creation_pending_status(self):
-        """GIVEN new test run data
+    @pytest.mark.parametrize(
+        "fields",
+        [
+            pytest.param(
+                {
+                    "run_id": "run_001",
+                    "scenario_id": "scen_001",
+                    "status": RunStatus.PENDING,
+                    "configuration_snapshot": {"version": "1.0"},
+                    "started_at": None,
+                    "completed_at": None,
+                },
+                id="pending",
+            ),
+            pytest.param(
+                {
+                    "run_id": "run_002",
+                    "scenario_id": "scen_001",
+                    "status": RunStatus.PASSED,
+                    "started_at": _NOW,
+                    "completed_at": _NOW,
+                    "duration_ms": 1500,
+                    "configuration_snapshot": {"version": "1.0"},
+                    "exit_code": 0,
+                },
+                id="completed",
+            ),
+            pytest.param(
+                {
+                    "run_id": "run_003",
+                    "scenario_id": "scen_002",
+                    "status": RunStatus.FAILED,
+                    "configuration_snapshot": {"version": "1.0"},
+                    "exit_code": 1,
+                    "error_message": "Service failed to restart within timeout",
+                },
+                id="failed_with_error",
+            ),
+        ],
+    )
+    def test_test_run_creation(self, fields):
+        """GIVEN test run data at some point in its lifecycle
         WHEN creating TestRun
-        THEN status should be PENDING and timestamps None
+        THEN every given field is stored as given
         """
-        test_run = TestRun(
-            run_id="run_001",
-            scenario_id="scen_001",
-            status=RunStatus.PENDING,
-            configuration_snapshot={"version": "1.0"},
-        )
+        test_run = TestRun(**fields)
 
-        assert test_run.run_id == "run_001"
-        assert test_run.scenario_id == "scen_001"
-        assert test_run.status == RunStatus.PENDING
-        assert test_run.started_at is None
-        assert test_run.completed_at is None
+        assert {name: getattr(test_run, name) for name in fields} == fields
+
+
+class TestChaosEventModel:
+    """GIVEN chaos injection data
+    WHEN ChaosEvent model is created
+    THEN model should record chaos injection details
+    """
+
+    @pytest.mark.parametrize(
+        "fields",
+        [
+            pytest.param(
+                {
+                    "event_id": "chaos_001",
+                    "run_id": "run_001",
+                    "event_type": EventType.SERVICE_RESTART,
+                    "target_service": "trading-engine",
+                    "parameters": ChaosParameters(graceful=True, delay_seconds=5),
+                    "injected_at": _NOW,
+                    "status": EventStatus.INJECTED,
+                },
+                id="service_restart",
+            ),
+            pytest.param(
+                {
+                    "event_id": "chaos_002",
+                    "run_id": "run_001",
+                    "event_type": EventType.NETWORK_LATENCY,
+                    "target_service": "risk-monitor",
+                    "parameters": {"latency_ms": 500},
+                    "injected_at": _NOW,
+                    "duration_ms": 10000,
+                    "status": EventStatus.RECOVERED,
+                    "recovery_time_ms": 2500,
+                },
+                id="recovered_with_metrics",
+            ),
+            pytest.param(
+                {
+                    "event_id": "chaos_003",
+                    "run_id": "run_002",
+                    "event_type": EventType.NETWORK_PARTITION,
+                    "target_service": "audit-correlator",
+                    "parameters": {
+                        "partition_type": "split_brain",
+                        "isolated_services": ["audit", "trading"],
+                    },
+                    "injected_at": _NOW,
+                    "status": EventStatus.IN_PROGRESS,
+                },
+                id="network_partition",
+            ),
+        ],
+    )
+    def test_chaos_event_creation(self, fields):
+        """GIVEN chaos injection data
+        WHEN creating ChaosEvent
+        THEN every given field is stored as given
+        """
+        event = ChaosEvent(**fields)
+
+        assert {name: getattr(event, name) for name in fields} == fields
+
+
+class TestTestResultModel:
+    """GIVEN test assertions and outcomes
+    WHEN TestResult model is created
+    THEN model should record assertion results
+    """
 
-    def test_test_run_lifecycle_tracking(self):
-        """GIVEN test run with timestamps
-        WHEN run completes
-        THEN duration should be calculated
+    @pytest.mark.parametrize(
+        "fields",
+        [
+            pytest.param(
+                {
+                    "result_id": "result_001",
+                    "run_id": "run_001",
+                    "assertion_type": AssertionType.SERVICE_HEALTH,
+                    "expected_value": "healthy",
+                    "actual_value": "healthy",
+                    "status": ResultStatus.PASSED,
+                    "verification_time": _NOW,
+                },
+                id="passed",
+            ),
+            pytest.param(
+                {
+                    "result_id": "result_002",
+                    "run_id": "run_002",
+                    "assertion_type": AssertionType.RESPONSE_TIME,
+                    "expected_value": "< 100ms",
+                    "actual_value": "250ms",
+                    "status": ResultStatus.FAILED,
+                    "verification_time": _NOW,
+                    "error_details": "Response time exceeded threshold: expected < 100ms, got 250ms",
+                },
+                id="failed_with_error_details",
+            ),
+            pytest.param(
+                {
+                    "result_id": "result_003",
+                    "run_id": "run_003",
+                    "assertion_type": AssertionType.DATA_CONSISTENCY,
+                    "expected_value": "no_data_loss",
+                    "actual_value": "no_data_loss",
+                    "status": ResultStatus.PASSED,
+                    "verification_time": _NOW,
+                    "correlation_id": "audit_trace_12345",
+                },
+                id="with_correlation_id",
+            ),
+            pytest.param(
+                {
+                    "result_id": "result_004",
+                    "run_id": "run_004",
+                    "assertion_type": AssertionType.AUDIT_TRAIL,
+                    "expected_value": "complete_event_sequence",
+                    "actual_value": "complete_event_sequence",
+                    "status": ResultStatus.PASSED,
+                    "verification_time": _NOW,
+                    "correlation_id": "audit_correlation_789",
+                },
+                id="audit_trail",
+            ),
+        ],
+    )
+    def test_result_creation(self, fields):
+        """GIVEN assertion outcome data
+        WHEN creating TestResult
+        THEN every given field is stored as given
         """
-        started = datetime.now(UTC)
-        completed = datetime.now(UTC)
+        result = TestResult(**fields)
+
+        assert {name: getattr(result, name) for name in fields} == fields
 
+
+class TestEnumValidation:
+    """GIVEN model data with an unknown enum value
+    WHEN the model is created
+    THEN validation should fail
+    """
+
+    _VALID = {
+        Scenario: {
+            "scenario_id": "scen_003",
+            "name": "Invalid Enum Test",
+            "scenario_type": ScenarioType.SERVICE_RESTART,
+            "configuration": {},
+        },
+        TestRun: {
+            "run_id": "run_001",
+            "scenario_id": "scen_001",
+            "status": RunStatus.PENDING,
+            "configuration_snapshot": {},
+        },
+        ChaosEvent: {
+            "event_id": "chaos_001",
+            "run_id": "run_001",
+            "event_type": EventType.SERVICE_RESTART,
+            "target_service": "trading-engine",
+            "parameters": {},
+            "injected_at": _NOW,
+            "status": EventStatus.INJECTED,
+        },
+        TestResult: {
+            "result_id": "result_001",
+            "run_id": "run_001",
+            "assertion_type": AssertionType.SERVICE_HEALTH,
+            "expected_value": "healthy",
+            "actual_value": "healthy",
+            "status": ResultStatus.PASSED,
+            "verification_time": _NOW,
+        },
+    }
+
+    @pytest.mark.parametrize(
+        "model, field",
+        [
+            (Scenario, "scenario_type"),
+            (Scenario, "status"),
+            (TestRun, "status"),
+            (ChaosEvent, "event_type"),
+            (ChaosEvent, "status"),
+            (TestResult, "assertion_type"),
+            (TestResult, "status"),
+        ],
+    )
+    def test_invalid_enum_value_rejected(self, model, field):
+        """GIVEN otherwise valid data with one enum field set to an unknown value
+        WHEN creating the model
+        THEN validation error should be raised
+        """
+        model(**self._VALID[model])
+
+        with pytest.raises(ValueError):
+            model(**{**self._VALID[model], field: "invalid_value"})
+
+
+class TestModelImmutability:
+    """GIVEN a domain model
+    WHEN changing it
+    THEN fields cannot be assigned and changes produce copies
+    """
+
+    def test_models_are_frozen(self):
+        """GIVEN a pending test run
+        WHEN assigning its status or copying it with a new status
+        THEN assignment fails and the copy leaves the original unchanged
+        """
         test_run = TestRun(
-            run_id="run_002",
+            run_id="run_001",
             scenario_id="scen_001",
-            status=RunStatus.PASSED,
-            started_at=started,
-            completed_at=completed,
-            duration_ms=1500,
-            configuration_snapshot={"version": "1.0"},
-            exit_code=0,
+            status=RunStatus.PENDING,
+            configuration_snapshot={},
         )
 
-        assert test_run.status == RunStatus.PASSED
-        assert test_run.started_at is not None
-        assert test_run.completed_at is not None
-        assert test_run.duration_ms == 1500
-        assert test_run.exit_code == 0
+        with pytest.raises(ValueError):
+            test_run.status = RunStatus.RUNNING  # type: ignore[misc]
+        running = test_run.model_copy(update={"status": RunStatus.RUNNING})
 
-    def test_test_run_with_error(self):
-        """GIVEN test run that failed
-        WHEN recording error details
-        THEN error message and non-zero exit code should be stored
+        assert running.status == RunStatus.RUNNING
+        assert test_run.status == RunStatus.PENDING
+
+    def test_models_compare_by_id(self):
+        """GIVEN two versions of the same test run and a different run
+        WHEN comparing and hashing them
+        THEN only the run ID decides equality
         """
         test_run = TestRun(
-            run_id="run_003",
-            scenario_id="scen_002",
-            status=RunStatus.FAILED,
+            run_id="run_001",
+            scenario_id="scen_001",
+            status=RunStatus.PENDING,
             configuration_snapshot={"version": "1.0"},
-            exit_code=1,
-            error_message="Service failed to restart within timeout",
         )
+        running = test_run.model_copy(update={"status": RunStatus.RUNNING})
+        other = test_run.model_copy(update={"run_id": "run_002"})
 
-        assert test_run.status == RunStatus.FAILED
-        assert test_run.exit_code == 1
-        assert "timeout" in test_run.error_message
+        assert running == test_run
+        assert other != test_run
+        assert len({test_run, running, other}) == 2
 
 
-class TestChaosEventModel:
-    """GIVEN chaos injection data
-    WHEN ChaosEvent model is created
-    THEN model should record chaos injection details
+class TestTrustedConstruction:
+    """GIVEN data read back from the adapter's own storage
+    WHEN building models with from_trusted
+    THEN models are built without validation but with typed enums and datetimes
     """
 
-    def test_chaos_event_service_restart(self):
-        """GIVEN service restart chaos event
-        WHEN creating ChaosEvent
-        THEN event details should be stored
+    def test_from_trusted_converts_enum_and_datetime_strings(self):
+        """GIVEN a stored run row with string status and timestamps
+        WHEN building TestRun with from_trusted
+        THEN status is a RunStatus and timestamps are datetimes
         """
-        event = ChaosEvent(
-            event_id="chaos_001",
-            run_id="run_001",
-            event_type=EventType.SERVICE_RESTART,
-            target_service="trading-engine",
-            parameters={"graceful": True, "delay_seconds": 5},
-            injected_at=datetime.now(UTC),
-            status=EventStatus.INJECTED,
+        run = TestRun.from_trusted(
+            {
+                "run_id": "run_001",
+                "scenario_id": "scen_001",
+                "status": "passed",
+                "started_at": "2025-10-06T10:00:00+00:00",
+                "completed_at": None,
+                "configuration_snapshot": {"version": "1.0"},
+            }
         )
 
-        assert event.event_id == "chaos_001"
-        assert event.event_type == EventType.SERVICE_RESTART
-        assert event.target_service == "trading-engine"
-        assert event.status == EventStatus.INJECTED
-        assert event.parameters["graceful"] is True
-
-    def test_chaos_event_with_recovery_metrics(self):
-        """GIVEN completed chaos event
-        WHEN event recovered
-        THEN recovery time should be recorded
+        assert run.status is RunStatus.PASSED
+        assert run.started_at == datetime(2025, 10, 6, 10, 0, tzinfo=UTC)
+        assert run.completed_at is None
+        assert run.duration_ms is None
+        assert run.model_fields_set == {
+            "run_id",
+            "scenario_id",
+            "status",
+            "started_at",
+            "completed_at",
+            "configuration_snapshot",
+        }
+
+    def test_from_trusted_matches_validated_model(self, now):
+        """GIVEN a chaos event dumped from a validated model
+        WHEN rebuilding it with from_trusted
+        THEN it equals the original
         """
         event = ChaosEvent(
-            event_id="chaos_002",
+            event_id="chaos_001",
             run_id="run_001",
-            event_type=EventType.NETWORK_LATENCY,
-            target_service="risk-monitor",
-            parameters={"latency_ms": 500},
-            injected_at=datetime.now(UTC),
-            duration_ms=10000,
+            event_type=EventType.SERVICE_RESTART,
+            target_service="trading-engine",
+            parameters={"graceful": True},
+            injected_at=now,
             status=EventStatus.RECOVERED,
             recovery_time_ms=2500,
         )
 
-        assert event.status == EventStatus.RECOVERED
-        assert event.duration_ms == 10000
-        assert event.recovery_time_ms == 2500
-
-    def test_chaos_event_network_partition(self):
-        """GIVEN network partition event
-        WHEN creating ChaosEvent
-        THEN network parameters should be stored
-        """
-        event = ChaosEvent(
-            event_id="chaos_003",
-            run_id="run_002",
-            event_type=EventType.NETWORK_PARTITION,
-            target_service="audit-correlator",
-            parameters={
-                "partition_type": "split_brain",
-                "isolated_services": ["audit", "trading"],
-            },
-            injected_at=datetime.now(UTC),
-            status=EventStatus.IN_PROGRESS,
-        )
-
-        assert event.event_type == EventType.NETWORK_PARTITION
-        assert "isolated_services" in event.parameters
-
+        rebuilt = ChaosEvent.from_trusted(event.model_dump(mode="json"))
 
-class TestTestResultModel:
-    """GIVEN test assertions and outcomes
-    WHEN TestResult model is created
-    THEN model should record assertion results
-    """
+        assert rebuilt.model_dump() == event.model_dump()
 
-    def test_result_assertion_passed(self):
-        """GIVEN successful assertion
-        WHEN creating TestResult
-        THEN status should be PASSED
+    def test_to_row_matches_row_columns(self, now):
+        """GIVEN a validated test result
+        WHEN converting it to a row
+        THEN values follow row_columns with enums reduced to their values
         """
         result = TestResult(
-            result_id="result_001",
+            result_id="r1",
             run_id="run_001",
-            assertion_type=AssertionType.SERVICE_HEALTH,
-            expected_value="healthy",
-            actual_value="healthy",
+            assertion_type=AssertionType.LATENCY,
+            expected_value="<100ms",
+            actual_value="80ms",
             status=ResultStatus.PASSED,
-            verification_time=datetime.now(UTC),
+            verification_time=now,
         )
 
-        assert result.status == ResultStatus.PASSED
-        assert result.expected_value == result.actual_value
-        assert result.assertion_type == AssertionType.SERVICE_HEALTH
+        row = dict(zip(TestResult.row_columns(), result.to_row(), strict=True))
 
-    def test_result_assertion_failed(self):
-        """GIVEN failed assertion
-        WHEN creating TestResult
-        THEN status should be FAILED with error details
-        """
-        result = TestResult(
-            result_id="result_002",
-            run_id="run_002",
-            assertion_type=AssertionType.RESPONSE_TIME,
-            expected_value="< 100ms",
-            actual_value="250ms",
-            status=ResultStatus.FAILED,
-            verification_time=datetime.now(UTC),
-            error_details="Response time exceeded threshold: expected < 100ms, got 250ms",
-        )
+        assert "kind" not in row
+        assert row["assertion_type"] == "latency"
+        assert type(row["status"]) is str
+        assert row["verification_time"] == now
 
-        assert result.status == ResultStatus.FAILED
-        assert result.expected_value != result.actual_value
-        assert "exceeded threshold" in result.error_details
 
-    def test_result_with_correlation_id(self):
-        """GIVEN test result with audit correlation
-        WHEN creating TestResult
-        THEN correlation_id should link to audit trail
-        """
-        result = TestResult(
-            result_id="result_003",
-            run_id="run_003",
-            assertion_type=AssertionType.DATA_CONSISTENCY,
-            expected_value="no_data_loss",
-            actual_value="no_data_loss",
-            status=ResultStatus.PASSED,
-            verification_time=datetime.now(UTC),
-            correlation_id="audit_trace_12345",
-        )
+class TestBatchValidation:
+    """GIVEN batches of inbound model data
+    WHEN validating them in one call
+    THEN every element is validated
+    """
 
-        assert result.correlation_id == "audit_trace_12345"
-        assert result.status == ResultStatus.PASSED
+    def test_validate_many_json_parses_batch(self):
+        """GIVEN a JSON array of test results
+        WHEN validating it as a batch
+        THEN every element is validated into a TestResult
+        """
+        payload = b"""[
+            {"result_id": "r1", "run_id": "run_001", "assertion_type": "latency",
+             "expected_value": "<100ms", "actual_value": "80ms", "status": "passed",
+             "verification_time": "2025-10-06T10:05:00Z"},
+            {"result_id": "r2", "run_id": "run_001", "assertion_type": "error_rate",
+             "expected_value": "<1%", "actual_value": "3%", "status": "failed",
+             "verification_time": "2025-10-06T10:06:00Z"}
+        ]"""
+
+        results = TestResult.validate_many_json(payload)
+
+        assert [r.result_id for r in results] == ["r1", "r2"]
+        assert results[1].status == ResultStatus.FAILED
+        assert results[0].verification_time.tzinfo is not None
+        with pytest.raises(ValueError):
+            TestResult.validate_many_json(b'[{"result_id": "r3"}]')
 
-    def test_result_audit_trail_assertion(self):
-        """GIVEN audit trail verification
-        WHEN creating TestResult
-        THEN assertion should verify audit completeness
+    def test_validate_many_rows(self):
+        """GIVEN scenario rows as dicts
+        WHEN validating them as a batch
+        THEN scenarios are returned in order with enums coerced
         """
-        result = TestResult(
-            result_id="result_004",
-            run_id="run_004",
-            assertion_type=AssertionType.AUDIT_TRAIL,
-            expected_value="complete_event_sequence",
-            actual_value="complete_event_sequence",
-            status=ResultStatus.PASSED,
-            verification_time=datetime.now(UTC),
-            correlation_id="audit_correlation_789",
-        )
+        rows = [
+            {"scenario_id": f"scen_{i}", "name": f"Scenario {i}", "scenario_type": "combined", "configuration": {}}
+            for i in range(3)
+        ]
 
-        assert result.assertion_type == AssertionType.AUDIT_TRAIL
-        assert result.status == ResultStatus.PASSED
+        scenarios = Scenario.validate_many(rows)
+
+        assert [s.scenario_id for s in scenarios] == ["scen_0", "scen_1", "scen_2"]
+        assert all(s.scenario_type is ScenarioType.COMBINED for s in scenarios)
+
+    def test_audit_records_select_model_by_kind(self):
+        """GIVEN an audit trail mixing runs, chaos events and results
+        WHEN validating it as AuditRecord values
+        THEN each element becomes the model named by its kind
+        """
+        payload = b"""[
+            {"kind": "run", "run_id": "run_001", "scenario_id": "scen_001",
+             "status": "running", "configuration_snapshot": {}},
+            {"kind": "event", "event_id": "chaos_001", "run_id": "run_001",
+             "event_type": "service_kill", "target_service": "trading-engine",
+             "parameters": {}, "injected_at": "2025-10-06T10:01:00Z", "status": "injected"},
+            {"kind": "result", "result_id": "r1", "run_id": "run_001",
+             "assertion_type": "latency", "expected_value": "<100ms",
+             "actual_value": "80ms", "status": "passed",
+             "verification_time": "2025-10-06T10:05:00Z"}
+        ]"""
+
+        records = TypeAdapter(list[AuditRecord]).validate_json(payload)
+
+        assert [type(r) for r in records] == [TestRun, ChaosEvent, TestResult]
+        assert TestRun(
+            run_id="run_002", scenario_id="scen_001", status=RunStatus.PENDING, configuration_snapshot={}
+        ).kind == "run"
@@ -1,12 +1,14 @@
 """Unit tests for stub repository implementations."""
+import asyncio
+import logging
 import pytest
-from datetime import datetime, UTC
+import structlog
+from datetime import datetime, UTC, timedelta
 from test_coordinator_data_adapter.adapters.stub import (
     StubScenariosRepository,
     StubTestRunsRepository,
     StubChaosEventsRepository,
     StubTestResultsRepository,
-    StubServiceDiscoveryRepository,
     StubCacheRepository,
 )
 from test_coordinator_data_adapter.models import (
@@ -22,19 +24,113 @@ from test_coordinator_data_adapter.models import (
     AssertionType,
     ResultStatus,
 )
-from test_coordinator_data_adapter.interfaces import ServiceInfo
+from structlog.testing import capture_logs
+from test_coordinator_data_adapter.batch_loader import BatchLoader
+from test_coordinator_data_adapter.adapters.stub import stub_cache, stub_test_runs
+from test_coordinator_data_adapter.adapters.stub.stub_cache import _glob_to_regex
+
+
+def _info_level_logger():
+    """Logger that filters below INFO, using the global processors so capture_logs sees it."""
+    return structlog.wrap_logger(
+        None, wrapper_class=structlog.make_filtering_bound_logger(logging.INFO)
+    )
+
+
+# Read-only tests share these repositories, seeded once per module with a
+# fixed timestamp that is never compared against the clock.
+_SEEDED_AT = datetime(2025, 10, 6, 10, 0, tzinfo=UTC)
+
+
+@pytest.fixture(scope="module")
+async def seeded_scenarios_repo():
+    """Scenarios repository with one restart and one latency scenario."""
+    repo = StubScenariosRepository()
+    await repo.bulk_create(
+        [
+            Scenario(
+                scenario_id="s1",
+                name="Restart",
+                scenario_type=ScenarioType.SERVICE_RESTART,
+                configuration={},
+            ),
+            Scenario(
+                scenario_id="s2",
+                name="Latency",
+                scenario_type=ScenarioType.NETWORK_LATENCY,
+                configuration={},
+            ),
+        ]
+    )
+    return repo
+
+
+@pytest.fixture(scope="module")
+async def seeded_chaos_events_repo():
+    """Chaos events repository with one injected and one recovered event."""
+    repo = StubChaosEventsRepository()
+    await repo.bulk_create(
+        [
+            ChaosEvent(
+                event_id="e1",
+                run_id="run-001",
+                event_type=EventType.SERVICE_RESTART,
+                target_service="svc1",
+                parameters={},
+                injected_at=_SEEDED_AT,
+                status=EventStatus.INJECTED,
+            ),
+            ChaosEvent(
+                event_id="e2",
+                run_id="run-001",
+                event_type=EventType.SERVICE_RESTART,
+                target_service="svc2",
+                parameters={},
+                injected_at=_SEEDED_AT,
+                status=EventStatus.RECOVERED,
+            ),
+        ]
+    )
+    return repo
+
+
+@pytest.fixture(scope="module")
+async def seeded_test_results_repo():
+    """Test results repository with one passed and one failed response time result."""
+    repo = StubTestResultsRepository()
+    await repo.bulk_create(
+        [
+            TestResult(
+                result_id="r1",
+                run_id="run-001",
+                assertion_type=AssertionType.RESPONSE_TIME,
+                status=ResultStatus.PASSED,
+                expected_value="< 100ms",
+                actual_value="75ms",
+                verification_time=_SEEDED_AT,
+            ),
+            TestResult(
+                result_id="r2",
+                run_id="run-001",
+                assertion_type=AssertionType.RESPONSE_TIME,
+                status=ResultStatus.FAILED,
+                expected_value="< 100ms",
+                actual_value="150ms",
+                verification_time=_SEEDED_AT,
+            ),
+        ]
+    )
+    return repo
 
 
-@pytest.mark.asyncio
 class TestStubScenariosRepository:
     """Test stub scenarios repository."""
 
-    async def test_create_and_retrieve_scenario(self):
+    async def test_create_and_retrieve_scenario(self, scenarios_repo):
         """GIVEN a stub scenarios repository
         WHEN creating and retrieving a scenario
         THEN the scenario is stored and retrieved correctly."""
         # Given
-        repo = StubScenariosRepository()
         scenario = Scenario(
             scenario_id="test-001",
             name="Service Restart Test",
@@ -45,355 +141,904 @@ class TestStubScenariosRepository:
         )
 
         # When
-        created = await repo.create(scenario)
-        retrieved = await repo.get_by_id("test-001")
+        created = await scenarios_repo.create(scenario)
+        retrieved = await scenarios_repo.get_by_id("test-001")
 
         # Then
-        assert created == scenario
-        assert retrieved == scenario
+        assert created is scenario
+        assert retrieved is scenario
         assert retrieved.name == "Service Restart Test"
 
-    async def test_get_by_type(self):
+    @pytest.mark.parametrize(
+        "scenario_type, expected_ids",
+        [
+            (ScenarioType.SERVICE_RESTART, ["s1"]),
+            (ScenarioType.NETWORK_LATENCY, ["s2"]),
+            (ScenarioType.COMBINED, []),
+        ],
+    )
+    async def test_get_by_type(self, seeded_scenarios_repo, scenario_type, expected_ids):
         """GIVEN scenarios of different types
         WHEN filtering by type
         THEN only matching scenarios are returned."""
+        # When
+        results = await seeded_scenarios_repo.get_by_type(scenario_type)
+
+        # Then
+        assert [s.scenario_id for s in results] == expected_ids
+
+    async def test_bulk_create_indexes_scenarios(self, scenarios_repo):
+        """GIVEN a batch of scenarios
+        WHEN bulk creating them
+        THEN each is retrievable by ID and by type."""
         # Given
-        repo = StubScenariosRepository()
-        await repo.create(
+        scenarios = [
             Scenario(
-                scenario_id="s1",
-                name="Restart",
+                scenario_id=f"s{i}",
+                name=f"Restart {i}",
                 scenario_type=ScenarioType.SERVICE_RESTART,
                 configuration={},
             )
+            for i in range(3)
+        ]
+
+        # When
+        created = await scenarios_repo.bulk_create(scenarios)
+
+        # Then
+        assert created == scenarios
+        assert await scenarios_repo.get_by_id("s2") == scenarios[2]
+        assert len(await scenarios_repo.get_by_type(ScenarioType.SERVICE_RESTART)) == 3
+
+    async def test_list_all_paginates(self, scenarios_repo):
+        """GIVEN more scenarios than one page
+        WHEN listing with limit and offset
+        THEN the requested window is returned in insertion order."""
+        # Given
+        await scenarios_repo.bulk_create(
+            [
+                Scenario(
+                    scenario_id=f"s{i}",
+                    name=f"Scenario {i}",
+                    scenario_type=ScenarioType.SERVICE_RESTART,
+                    configuration={},
+                )
+                for i in range(5)
+            ]
         )
-        await repo.create(
+
+        # When
+        page = await scenarios_repo.list_all(limit=2, offset=3)
+        past_end = await scenarios_repo.list_all(limit=2, offset=10)
+
+        # Then
+        assert [s.scenario_id for s in page] == ["s3", "s4"]
+        assert past_end == []
+
+    async def test_status_and_tag_queries_follow_updates(self, scenarios_repo):
+        """GIVEN a stored scenario
+        WHEN its status changes and it is later deleted
+        THEN status and tag queries reflect each change."""
+        # Given
+        await scenarios_repo.create(
             Scenario(
-                scenario_id="s2",
-                name="Latency",
-                scenario_type=ScenarioType.NETWORK_LATENCY,
+                scenario_id="s1",
+                name="Restart",
+                scenario_type=ScenarioType.SERVICE_RESTART,
                 configuration={},
+                tags=["smoke", "nightly"],
             )
         )
 
         # When
-        results = await repo.get_by_type(ScenarioType.SERVICE_RESTART)
+        await scenarios_repo.update_status("s1", ScenarioStatus.ACTIVE)
 
         # Then
-        assert len(results) == 1
-        assert results[0].scenario_id == "s1"
+        assert await scenarios_repo.get_by_status(ScenarioStatus.DRAFT) == []
+        assert [s.scenario_id for s in await scenarios_repo.get_active_scenarios()] == ["s1"]
+        assert [s.scenario_id for s in await scenarios_repo.search_by_tag("nightly")] == ["s1"]
+
+        # When
+        await scenarios_repo.delete("s1")
+
+        # Then
+        assert await scenarios_repo.get_active_scenarios() == []
+        assert await scenarios_repo.search_by_tag("smoke") == []
 
 
-@pytest.mark.asyncio
 class TestStubTestRunsRepository:
     """Test stub test runs repository."""
 
-    async def test_create_and_start_run(self):
+    async def test_debug_logging_disabled_below_debug_level(self, monkeypatch):
+        """GIVEN the repository logger filtering below INFO
+        WHEN running a test run through its lifecycle
+        THEN no debug events are emitted and the run still completes."""
+        # Given
+        monkeypatch.setattr(stub_test_runs, "logger", _info_level_logger())
+        with capture_logs() as logs:
+            repo = StubTestRunsRepository()
+            await repo.create(
+                TestRun(
+                    run_id="run-001",
+                    scenario_id="test-001",
+                    status=RunStatus.PENDING,
+                    configuration_snapshot={},
+                )
+            )
+
+            # When
+            await repo.start_run("run-001")
+            completed = await repo.complete_run("run-001", RunStatus.PASSED, exit_code=0)
+
+        # Then
+        assert [e["event"] for e in logs] == ["stub_test_runs_repository_initialized"]
+        assert completed.status == RunStatus.PASSED
+
+    async def test_batch_loader_coalesces_get_many_by_ids(self, test_runs_repo):
+        """GIVEN a batch loader over the repository's get_many_by_ids
+        WHEN loading several runs concurrently, including repeats and a missing ID
+        THEN one batched lookup serves every load."""
+        # Given
+        for i in range(3):
+            await test_runs_repo.create(
+                TestRun(
+                    run_id=f"run-{i}",
+                    scenario_id="test-001",
+                    status=RunStatus.PENDING,
+                    configuration_snapshot={},
+                )
+            )
+        batches = []
+
+        async def load_many(run_ids):
+            batches.append(run_ids)
+            return await test_runs_repo.get_many_by_ids(run_ids)
+
+        loader = BatchLoader(load_many)
+
+        # When
+        runs = await asyncio.gather(
+            loader.load("run-0"),
+            loader.load("run-2"),
+            loader.load("run-0"),
+            loader.load("missing"),
+        )
+
+        # Then
+        assert batches == [["run-0", "run-2", "missing"]]
+        assert [run.run_id if run else None for run in runs] == ["run-0", "run-2", "run-0", None]
+
+    async def test_batch_loader_cancelled_caller_leaves_others_waiting(self):
+        """GIVEN two callers loading the same key
+        WHEN one caller is cancelled before the batch completes
+        THEN the other still receives the loaded value."""
+        # Given
+        release = asyncio.Event()
+
+        async def load_many(keys):
+            await release.wait()
+            return {key: key.upper() for key in keys}
+
+        loader = BatchLoader(load_many)
+        cancelled = asyncio.create_task(loader.load("run-0"))
+        waiting = asyncio.create_task(loader.load("run-0"))
+        await asyncio.sleep(0)
+
+        # When
+        cancelled.cancel()
+        await asyncio.sleep(0)
+        release.set()
+
+        # Then
+        assert await waiting == "RUN-0"
+        assert cancelled.cancelled()
+
+    async def test_batch_loader_cancelled_flush_releases_callers(self):
+        """GIVEN a batch whose flush is cancelled mid-load
+        WHEN callers await their keys
+        THEN they are cancelled instead of waiting forever."""
+        # Given
+        async def load_many(keys):
+            asyncio.current_task().cancel()
+            await asyncio.sleep(0)
+            return {}
+
+        loader = BatchLoader(load_many)
+
+        # When / Then
+        with pytest.raises(asyncio.CancelledError):
+            await asyncio.wait_for(loader.load_many(["run-0", "run-1"]), timeout=1)
+
+    async def test_create_and_start_run(self, test_runs_repo):
         """GIVEN a test run
         WHEN starting the run
         THEN status and timestamp are updated."""
         # Given
-        repo = StubTestRunsRepository()
         run = TestRun(
             run_id="run-001",
             scenario_id="test-001",
             status=RunStatus.PENDING,
             configuration_snapshot={"version": "1.0"},
         )
-        await repo.create(run)
+        await test_runs_repo.create(run)
 
         # When
-        started = await repo.start_run("run-001")
+        started = await test_runs_repo.start_run("run-001")
 
         # Then
         assert started.status == RunStatus.RUNNING
         assert started.started_at is not None
 
-    async def test_complete_run_with_duration(self):
+    async def test_complete_run_with_duration(self, test_runs_repo):
         """GIVEN a running test
         WHEN completing the run
         THEN duration is calculated."""
         # Given
-        repo = StubTestRunsRepository()
         run = TestRun(
             run_id="run-001",
             scenario_id="test-001",
             status=RunStatus.PENDING,
             configuration_snapshot={"version": "1.0"},
         )
-        await repo.create(run)
-        await repo.start_run("run-001")
+        started = await test_runs_repo.create_started_run(run)
 
         # When
-        completed = await repo.complete_run("run-001", RunStatus.PASSED, exit_code=0)
+        completed = await test_runs_repo.complete_run("run-001", RunStatus.PASSED, exit_code=0)
 
         # Then
+        assert started.status == RunStatus.RUNNING
+        assert await test_runs_repo.get_by_status(RunStatus.RUNNING) == []
         assert completed.status == RunStatus.PASSED
         assert completed.completed_at is not None
         assert completed.duration_ms is not None
         assert completed.duration_ms >= 0
 
+    async def test_complete_runs_batch(self, test_runs_repo):
+        """GIVEN started runs
+        WHEN completing them in one batch
+        THEN all share a completion time and unknown IDs leave runs untouched."""
+        # Given
+        for run_id in ("run-1", "run-2"):
+            await test_runs_repo.create(
+                TestRun(
+                    run_id=run_id,
+                    scenario_id="s1",
+                    status=RunStatus.PENDING,
+                    configuration_snapshot={},
+                )
+            )
+            await test_runs_repo.start_run(run_id)
+
+        # When
+        with pytest.raises(ValueError, match="missing"):
+            await test_runs_repo.complete_runs(
+                [("run-1", RunStatus.PASSED, 0), ("missing", RunStatus.PASSED, 0)]
+            )
+        completed = await test_runs_repo.complete_runs(
+            [("run-1", RunStatus.PASSED, 0), ("run-2", RunStatus.FAILED, 1)]
+        )
+
+        # Then
+        assert [r.status for r in completed] == [RunStatus.PASSED, RunStatus.FAILED]
+        assert completed[0].completed_at == completed[1].completed_at
+        assert all(r.duration_ms is not None for r in completed)
+        assert await test_runs_repo.calculate_pass_rate("s1") == 0.5
+
+    async def test_complete_run_started_elsewhere_uses_started_at(self, test_runs_repo, now):
+        """GIVEN a run created with a started_at a minute ago
+        WHEN completing it without calling start_run
+        THEN duration is derived from the wall-clock start time."""
+        # Given
+        await test_runs_repo.create(
+            TestRun(
+                run_id="run-001",
+                scenario_id="test-001",
+                status=RunStatus.RUNNING,
+                configuration_snapshot={},
+                started_at=now - timedelta(minutes=1),
+            )
+        )
+
+        # When
+        completed = await test_runs_repo.complete_run("run-001", RunStatus.PASSED, exit_code=0)
+
+        # Then
+        assert 60_000 <= completed.duration_ms < 70_000
+
+    async def test_scenario_and_status_queries_follow_transitions(self, test_runs_repo):
+        """GIVEN runs of two scenarios
+        WHEN runs start, complete and are deleted
+        THEN scenario and status queries and aggregates reflect the changes."""
+        # Given
+        for run_id, scenario_id in (("run-1", "s1"), ("run-2", "s1"), ("run-3", "s2")):
+            await test_runs_repo.create(
+                TestRun(
+                    run_id=run_id,
+                    scenario_id=scenario_id,
+                    status=RunStatus.PENDING,
+                    configuration_snapshot={},
+                )
+            )
+
+        # When
+        await test_runs_repo.start_run("run-1")
+        await test_runs_repo.record_completion("run-2", exit_code=0, duration_ms=300)
+        await test_runs_repo.record_completion("run-3", exit_code=1, duration_ms=100)
+        await test_runs_repo.delete("run-3")
+
+        # Then
+        assert [r.run_id for r in await test_runs_repo.get_by_scenario("s1")] == ["run-1", "run-2"]
+        assert await test_runs_repo.get_by_scenario("s2") == []
+        assert [r.run_id for r in await test_runs_repo.get_by_status(RunStatus.RUNNING)] == ["run-1"]
+        assert await test_runs_repo.get_by_status(RunStatus.PENDING) == []
+        assert await test_runs_repo.get_failed_runs() == []
+        assert await test_runs_repo.calculate_pass_rate("s1") == 0.5
+        assert await test_runs_repo.get_average_duration("s1") == 300.0
+
+    async def test_iterate_by_scenario_and_status(self, test_runs_repo):
+        """GIVEN runs of two scenarios
+        WHEN iterating by scenario and by status
+        THEN the same runs as the list queries are yielded."""
+        # Given
+        for run_id, scenario_id in (("run-1", "s1"), ("run-2", "s2"), ("run-3", "s1")):
+            await test_runs_repo.create(
+                TestRun(
+                    run_id=run_id,
+                    scenario_id=scenario_id,
+                    status=RunStatus.PENDING,
+                    configuration_snapshot={},
+                )
+            )
+        await test_runs_repo.start_run("run-3")
+
+        # When
+        by_scenario = [r.run_id for r in test_runs_repo.iter_by_scenario("s1")]
+        pending = [r.run_id for r in test_runs_repo.iter_by_status(RunStatus.PENDING)]
+
+        # Then
+        assert by_scenario == ["run-1", "run-3"]
+        assert pending == ["run-1", "run-2"]
+        assert list(test_runs_repo.iter_by_scenario("unknown")) == []
+        assert [r.run_id for r in await test_runs_repo.get_by_scenario("s1")] == by_scenario
+        assert await test_runs_repo.count_by_scenario("s1") == 2
+        assert await test_runs_repo.count_by_status(RunStatus.RUNNING) == 1
+        assert await test_runs_repo.count_by_status(RunStatus.PASSED) == 0
+
+    async def test_aggregates_follow_updates_and_deletes(self, test_runs_repo):
+        """GIVEN completed runs of a scenario
+        WHEN a run is replaced via update and another is deleted
+        THEN pass rate and average duration reflect the current runs."""
+        # Given
+        for run_id in ("run-1", "run-2", "run-3"):
+            await test_runs_repo.create(
+                TestRun(
+                    run_id=run_id,
+                    scenario_id="s1",
+                    status=RunStatus.PENDING,
+                    configuration_snapshot={},
+                )
+            )
+            await test_runs_repo.record_completion(run_id, exit_code=0, duration_ms=100)
+
+        # When
+        await test_runs_repo.update(
+            TestRun(
+                run_id="run-2",
+                scenario_id="s1",
+                status=RunStatus.FAILED,
+                configuration_snapshot={},
+                duration_ms=400,
+            )
+        )
+        await test_runs_repo.delete("run-3")
+
+        # Then
+        assert await test_runs_repo.calculate_pass_rate("s1") == 0.5
+        assert await test_runs_repo.get_average_duration("s1") == 250.0
+        await test_runs_repo.delete("run-1")
+        await test_runs_repo.delete("run-2")
+        assert await test_runs_repo.calculate_pass_rate("s1") == 0.0
+        assert await test_runs_repo.get_average_duration("s1") == 0.0
+
+    async def test_runs_by_date_range(self, test_runs_repo, now):
+        """GIVEN runs started at different times, one restarted later
+        WHEN querying a date range
+        THEN only runs whose current start falls in it are returned, oldest first."""
+        # Given
+        base = datetime(2025, 1, 1, tzinfo=UTC)
+        for i in (3, 0, 2, 1):
+            await test_runs_repo.create(
+                TestRun(
+                    run_id=f"run-{i}",
+                    scenario_id="s1",
+                    status=RunStatus.RUNNING,
+                    configuration_snapshot={},
+                    started_at=base + timedelta(days=i),
+                )
+            )
+        await test_runs_repo.create(
+            TestRun(run_id="run-x", scenario_id="s1", status=RunStatus.PENDING, configuration_snapshot={})
+        )
+
+        # When
+        await test_runs_repo.start_run("run-1")
+        await test_runs_repo.delete("run-0")
+        result = await test_runs_repo.get_runs_by_date_range(base, base + timedelta(days=2))
+
+        # Then
+        assert [r.run_id for r in result] == ["run-2"]
+        everything = await test_runs_repo.get_runs_by_date_range(base, now + timedelta(days=1))
+        assert [r.run_id for r in everything] == ["run-2", "run-3", "run-1"]
+
+    async def test_recent_and_failed_runs_newest_first(self, test_runs_repo):
+        """GIVEN started, unstarted and failed runs
+        WHEN getting recent and failed runs with a limit
+        THEN the newest runs are returned first, unstarted runs last."""
+        # Given
+        base = datetime(2025, 1, 1, tzinfo=UTC)
+        for i in range(5):
+            await test_runs_repo.create(
+                TestRun(
+                    run_id=f"run-{i}",
+                    scenario_id="s1",
+                    status=RunStatus.FAILED if i % 2 else RunStatus.PENDING,
+                    configuration_snapshot={},
+                    started_at=base + timedelta(minutes=i) if i < 4 else None,
+                    completed_at=base + timedelta(minutes=i, seconds=30) if i % 2 else None,
+                )
+            )
+
+        # When
+        recent = await test_runs_repo.get_recent_runs(limit=3)
+        everything = await test_runs_repo.get_recent_runs(limit=10)
+        failed = await test_runs_repo.get_failed_runs(limit=1)
+
+        # Then
+        assert [r.run_id for r in recent] == ["run-3", "run-2", "run-1"]
+        assert everything[-1].run_id == "run-4"
+        assert [r.run_id for r in failed] == ["run-3"]
+
 
-@pytest.mark.asyncio
 class TestStubChaosEventsRepository:
     """Test stub chaos events repository."""
 
-    async def test_create_and_record_recovery(self):
+    async def test_create_and_record_recovery(self, chaos_events_repo, now):
         """GIVEN a chaos event
         WHEN recording recovery
         THEN recovery time and status are updated."""
         # Given
-        repo = StubChaosEventsRepository()
         event = ChaosEvent(
             event_id="evt-001",
             run_id="run-001",
             event_type=EventType.SERVICE_RESTART,
             target_service="trading-engine",
             parameters={"graceful": True},
-            injected_at=datetime.now(UTC),
+            injected_at=now,
             status=EventStatus.INJECTED,
         )
-        await repo.create(event)
+        await chaos_events_repo.create(event)
 
         # When
-        recovered = await repo.record_recovery("evt-001", recovery_time_ms=1500)
+        recovered = await chaos_events_repo.record_recovery("evt-001", recovery_time_ms=1500)
 
         # Then
         assert recovered.status == EventStatus.RECOVERED
         assert recovered.recovery_time_ms == 1500
 
-    async def test_get_active_events(self):
-        """GIVEN events with different statuses
-        WHEN getting active events
-        THEN only active events are returned."""
+    async def test_calculate_average_recovery_time(self, chaos_events_repo, now):
+        """GIVEN recovered events of one type
+        WHEN a recovery is recorded again for the same event
+        THEN the average uses only the latest recovery time."""
         # Given
-        repo = StubChaosEventsRepository()
-        now = datetime.now(UTC)
-        await repo.create(
-            ChaosEvent(
-                event_id="e1",
-                run_id="run-001",
-                event_type=EventType.SERVICE_RESTART,
-                target_service="svc1",
-                parameters={},
-                injected_at=now,
-                status=EventStatus.INJECTED,
+        for event_id in ("e1", "e2"):
+            await chaos_events_repo.create(
+                ChaosEvent(
+                    event_id=event_id,
+                    run_id="run-001",
+                    event_type=EventType.SERVICE_RESTART,
+                    target_service="svc1",
+                    parameters={},
+                    injected_at=now,
+                    status=EventStatus.INJECTED,
+                )
             )
-        )
-        await repo.create(
-            ChaosEvent(
-                event_id="e2",
-                run_id="run-001",
-                event_type=EventType.SERVICE_RESTART,
-                target_service="svc2",
-                parameters={},
-                injected_at=now,
-                status=EventStatus.RECOVERED,
+        await chaos_events_repo.record_recovery("e1", recovery_time_ms=1000)
+        await chaos_events_repo.record_recovery("e2", recovery_time_ms=3000)
+
+        # When
+        await chaos_events_repo.record_recovery("e2", recovery_time_ms=2000)
+        average = await chaos_events_repo.calculate_average_recovery_time(EventType.SERVICE_RESTART)
+
+        # Then
+        assert average == 1500.0
+        assert await chaos_events_repo.calculate_average_recovery_time(EventType.CPU_STRESS) == 0.0
+
+    @pytest.mark.parametrize(
+        "query, expected_ids",
+        [
+            pytest.param(lambda repo: repo.get_active_events(), ["e1"], id="active"),
+            pytest.param(lambda repo: repo.get_by_service("svc2"), ["e2"], id="by_service"),
+            pytest.param(
+                lambda repo: repo.get_by_type(EventType.SERVICE_RESTART), ["e1", "e2"], id="by_type"
+            ),
+        ],
+    )
+    async def test_filter_events(self, seeded_chaos_events_repo, query, expected_ids):
+        """GIVEN events with different statuses and targets
+        WHEN filtering events
+        THEN only matching events are returned."""
+        # When
+        events = await query(seeded_chaos_events_repo)
+
+        # Then
+        assert [e.event_id for e in events] == expected_ids
+
+    async def test_active_events_follow_status_changes(self, chaos_events_repo, now):
+        """GIVEN injected chaos events
+        WHEN one progresses and another recovers
+        THEN active events track the current statuses."""
+        # Given
+        for event_id in ("e1", "e2"):
+            await chaos_events_repo.create(
+                ChaosEvent(
+                    event_id=event_id,
+                    run_id="run-001",
+                    event_type=EventType.NETWORK_PARTITION,
+                    target_service="svc1",
+                    parameters={},
+                    injected_at=now,
+                    status=EventStatus.INJECTED,
+                )
             )
-        )
 
         # When
-        active = await repo.get_active_events()
+        await chaos_events_repo.update_status("e1", EventStatus.IN_PROGRESS)
+        await chaos_events_repo.record_recovery("e2", recovery_time_ms=500)
 
         # Then
-        assert len(active) == 1
-        assert active[0].event_id == "e1"
+        active = await chaos_events_repo.get_active_events()
+        assert [e.event_id for e in active] == ["e1"]
+        await chaos_events_repo.update_status("e1", EventStatus.FAILED)
+        assert await chaos_events_repo.get_active_events() == []
 
 
-@pytest.mark.asyncio
 class TestStubTestResultsRepository:
     """Test stub test results repository."""
 
-    async def test_calculate_pass_rate(self):
+    async def test_calculate_pass_rate(self, test_results_repo, now):
         """GIVEN test results with mixed outcomes
         WHEN calculating pass rate
         THEN correct percentage is returned."""
         # Given
-        repo = StubTestResultsRepository()
-        now = datetime.now(UTC)
-        for i in range(3):
-            await repo.create(
+        passed = TestResult(
+            result_id="res-0",
+            run_id="run-001",
+            assertion_type=AssertionType.SERVICE_HEALTH,
+            status=ResultStatus.PASSED,
+            expected_value="healthy",
+            actual_value="healthy",
+            verification_time=now,
+        )
+        await test_results_repo.bulk_create(
+            [
+                passed,
+                passed.model_copy(update={"result_id": "res-1"}),
+                passed.model_copy(update={"result_id": "res-2"}),
+                passed.model_copy(
+                    update={
+                        "result_id": "res-failed",
+                        "status": ResultStatus.FAILED,
+                        "actual_value": "unhealthy",
+                    }
+                ),
+            ]
+        )
+
+        # When
+        pass_rate = await test_results_repo.calculate_pass_rate("run-001")
+
+        # Then
+        assert pass_rate == 0.75  # 3 passed out of 4 total
+
+    async def test_get_status_counts(self, test_results_repo, now):
+        """GIVEN results with mixed outcomes across runs
+        WHEN getting status counts for one run
+        THEN only that run's non-empty statuses are counted."""
+        # Given
+        for result_id, run_id, status in [
+            ("r1", "run-001", ResultStatus.PASSED),
+            ("r2", "run-001", ResultStatus.PASSED),
+            ("r3", "run-001", ResultStatus.FAILED),
+            ("r4", "run-002", ResultStatus.SKIPPED),
+        ]:
+            await test_results_repo.create(
                 TestResult(
-                    result_id=f"res-{i}",
-                    run_id="run-001",
+                    result_id=result_id,
+                    run_id=run_id,
                     assertion_type=AssertionType.SERVICE_HEALTH,
-                    status=ResultStatus.PASSED,
+                    status=status,
                     expected_value="healthy",
-                    actual_value="healthy",
+                    actual_value="unknown",
                     verification_time=now,
                 )
             )
-        await repo.create(
-            TestResult(
-                result_id="res-failed",
-                run_id="run-001",
-                assertion_type=AssertionType.SERVICE_HEALTH,
-                status=ResultStatus.FAILED,
-                expected_value="healthy",
-                actual_value="unhealthy",
-                verification_time=now,
-            )
-        )
 
         # When
-        pass_rate = await repo.calculate_pass_rate("run-001")
+        counts = await test_results_repo.get_status_counts("run-001")
 
         # Then
-        assert pass_rate == 0.75  # 3 passed out of 4 total
+        assert counts == {ResultStatus.PASSED: 2, ResultStatus.FAILED: 1}
 
-    async def test_get_assertion_statistics(self):
-        """GIVEN test results of specific assertion type
-        WHEN getting statistics
-        THEN correct counts are returned."""
+    async def test_bulk_create_reindexes_existing_results(self, test_results_repo, now):
+        """GIVEN a stored passed result
+        WHEN bulk creating it again as failed alongside a new result
+        THEN each status index holds the results in insertion order."""
         # Given
-        repo = StubTestResultsRepository()
-        now = datetime.now(UTC)
-        await repo.create(
-            TestResult(
-                result_id="r1",
+        def make(result_id, status):
+            return TestResult(
+                result_id=result_id,
                 run_id="run-001",
-                assertion_type=AssertionType.RESPONSE_TIME,
-                status=ResultStatus.PASSED,
-                expected_value="< 100ms",
-                actual_value="75ms",
-                verification_time=now,
-            )
-        )
-        await repo.create(
-            TestResult(
-                result_id="r2",
-                run_id="run-001",
-                assertion_type=AssertionType.RESPONSE_TIME,
-                status=ResultStatus.FAILED,
+                assertion_type=AssertionType.LATENCY,
+                status=status,
                 expected_value="< 100ms",
                 actual_value="150ms",
                 verification_time=now,
             )
+
+        await test_results_repo.bulk_create(
+            [make("r1", ResultStatus.PASSED), make("r2", ResultStatus.FAILED)]
+        )
+
+        # When
+        await test_results_repo.bulk_create(
+            [make("r1", ResultStatus.FAILED), make("r3", ResultStatus.PASSED)]
         )
 
+        # Then
+        passed = await test_results_repo.get_by_status(ResultStatus.PASSED)
+        failed = await test_results_repo.get_failed_results("run-001")
+        assert [r.result_id for r in passed] == ["r3"]
+        assert [r.result_id for r in failed] == ["r2", "r1"]
+
+    async def test_get_failed_results_for_run(self, test_results_repo, now):
+        """GIVEN results for several runs
+        WHEN getting failed results for one run
+        THEN only that run's failures are returned."""
+        # Given
+        for result_id, run_id, status in [
+            ("r1", "run-001", ResultStatus.FAILED),
+            ("r2", "run-001", ResultStatus.PASSED),
+            ("r3", "run-002", ResultStatus.FAILED),
+        ]:
+            await test_results_repo.create(
+                TestResult(
+                    result_id=result_id,
+                    run_id=run_id,
+                    assertion_type=AssertionType.SERVICE_HEALTH,
+                    status=status,
+                    expected_value="healthy",
+                    actual_value="unknown",
+                    verification_time=now,
+                )
+            )
+
+        # When
+        failed = await test_results_repo.get_failed_results("run-001")
+
+        # Then
+        assert [r.result_id for r in failed] == ["r1"]
+
+    @pytest.mark.parametrize(
+        "assertion_type, expected",
+        [
+            (
+                AssertionType.RESPONSE_TIME,
+                {"total": 2, "passed": 1, "failed": 1, "skipped": 0, "pass_rate": 0.5},
+            ),
+            (
+                AssertionType.SERVICE_HEALTH,
+                {"total": 0, "passed": 0, "failed": 0, "skipped": 0, "pass_rate": 0.0},
+            ),
+        ],
+    )
+    async def test_get_assertion_statistics(self, seeded_test_results_repo, assertion_type, expected):
+        """GIVEN test results of specific assertion type
+        WHEN getting statistics
+        THEN correct counts are returned."""
         # When
-        stats = await repo.get_assertion_statistics(AssertionType.RESPONSE_TIME)
+        stats = await seeded_test_results_repo.get_assertion_statistics(assertion_type)
 
         # Then
-        assert stats["total"] == 2
-        assert stats["passed"] == 1
-        assert stats["failed"] == 1
-        assert stats["pass_rate"] == 0.5
+        assert stats == expected
 
 
-@pytest.mark.asyncio
 class TestStubServiceDiscoveryRepository:
     """Test stub service discovery repository."""
 
-    async def test_register_and_retrieve_service(self):
+    async def test_register_and_retrieve_service(self, service_discovery_repo, make_service):
         """GIVEN a service registration
         WHEN registering and retrieving
         THEN service info is stored correctly."""
         # Given
-        repo = StubServiceDiscoveryRepository()
-        service = ServiceInfo(
-            service_id="svc-001",
-            service_name="trading-engine",
-            version="1.0.0",
-            host="localhost",
-            grpc_port=50051,
-            http_port=8080,
-            last_seen=datetime.now(UTC),
-            registered_at=datetime.now(UTC),
+        service = make_service("svc-001")
+
+        # When
+        registered = await service_discovery_repo.register(service)
+        retrieved = await service_discovery_repo.get_service_by_id("svc-001")
+
+        # Then
+        assert registered is service
+        assert retrieved is service
+
+    async def test_bulk_register(self, service_discovery_repo, make_service):
+        """GIVEN several service registrations
+        WHEN registering them in one call
+        THEN all services are stored."""
+        # Given
+        services = [
+            make_service(f"svc-{i}", grpc_port=50051 + i, http_port=8080 + i) for i in range(2)
+        ]
+
+        # When
+        await service_discovery_repo.bulk_register(services)
+
+        # Then
+        assert await service_discovery_repo.get_service_count() == 2
+        assert await service_discovery_repo.get_service_by_id("svc-1") is services[1]
+
+    async def test_list_all_services_columns(self, service_discovery_repo, make_service):
+        """GIVEN registered services
+        WHEN listing selected columns
+        THEN parallel lists of those fields are returned."""
+        # Given
+        await service_discovery_repo.bulk_register(
+            [make_service(f"svc-{i}", host=f"host-{i}") for i in range(2)]
+        )
+
+        # When
+        columns = await service_discovery_repo.list_all_services_columns(("service_id", "host"))
+
+        # Then
+        assert columns == {"service_id": ["svc-0", "svc-1"], "host": ["host-0", "host-1"]}
+        with pytest.raises(ValueError, match="port"):
+            await service_discovery_repo.list_all_services_columns(("port",))
+
+    async def test_lookup_by_name_follows_registrations(self, service_discovery_repo, make_service):
+        """GIVEN two instances of one service
+        WHEN one instance deregisters
+        THEN name lookups return only the remaining instance."""
+        # Given
+        await service_discovery_repo.bulk_register(
+            [make_service(f"svc-{i}", grpc_port=50051 + i, http_port=8080 + i) for i in range(2)]
         )
 
         # When
-        registered = await repo.register(service)
-        retrieved = await repo.get_service_by_id("svc-001")
+        first_before = await service_discovery_repo.get_service_by_name("trading-engine")
+        await service_discovery_repo.deregister("svc-0")
 
         # Then
-        assert registered == service
-        assert retrieved == service
+        assert first_before.service_id == "svc-0"
+        remaining = await service_discovery_repo.list_services_by_name("trading-engine")
+        assert [s.service_id for s in remaining] == ["svc-1"]
+        assert (await service_discovery_repo.get_service_by_name("trading-engine")).service_id == "svc-1"
+        assert await service_discovery_repo.get_service_by_name("unknown") is None
 
-    async def test_update_heartbeat(self):
+    async def test_update_heartbeat(self, service_discovery_repo, make_service, now):
         """GIVEN a registered service
         WHEN updating heartbeat
         THEN last_seen timestamp is updated."""
         # Given
-        repo = StubServiceDiscoveryRepository()
-        now = datetime.now(UTC)
-        service = ServiceInfo(
-            service_id="svc-001",
-            service_name="test-svc",
-            version="1.0.0",
-            host="localhost",
-            grpc_port=50051,
-            http_port=8080,
-            last_seen=now,
-            registered_at=now,
-        )
-        await repo.register(service)
+        minute_ago = now - timedelta(minutes=1)
+        service = make_service("svc-001", last_seen=minute_ago, registered_at=minute_ago)
+        await service_discovery_repo.register(service)
 
         # When
-        updated = await repo.update_heartbeat("svc-001")
+        updated = await service_discovery_repo.update_heartbeat("svc-001")
 
         # Then
-        assert updated.last_seen >= service.last_seen
+        assert updated.last_seen > service.last_seen
 
-    async def test_remove_stale_services(self):
+    async def test_remove_stale_services(self, service_discovery_repo, make_service, now):
         """GIVEN services with old heartbeats
         WHEN removing stale services
         THEN old services are removed."""
         # Given
-        repo = StubServiceDiscoveryRepository()
-        from datetime import timedelta
-
-        old_time = datetime.now(UTC) - timedelta(seconds=120)
-        recent_time = datetime.now(UTC)
-
-        await repo.register(
-            ServiceInfo(
-                service_id="old-svc",
-                service_name="old",
-                version="1.0.0",
-                host="localhost",
-                grpc_port=50051,
-                http_port=8080,
-                last_seen=old_time,
-                registered_at=old_time,
-            )
-        )
-        await repo.register(
-            ServiceInfo(
-                service_id="new-svc",
-                service_name="new",
-                version="1.0.0",
-                host="localhost",
-                grpc_port=50052,
-                http_port=8081,
-                last_seen=recent_time,
-                registered_at=recent_time,
-            )
+        old_time = now - timedelta(seconds=120)
+
+        await service_discovery_repo.bulk_register(
+            [
+                make_service(
+                    "old-svc", service_name="old", last_seen=old_time, registered_at=old_time
+                ),
+                make_service("new-svc", service_name="new", grpc_port=50052, http_port=8081),
+            ]
         )
 
         # When
-        removed = await repo.remove_stale_services(threshold_seconds=60)
+        removed = await service_discovery_repo.remove_stale_services(threshold_seconds=60)
 
         # Then
         assert removed == 1
-        assert await repo.get_service_by_id("old-svc") is None
-        assert await repo.get_service_by_id("new-svc") is not None
+        assert await service_discovery_repo.get_service_by_id("old-svc") is None
+        assert await service_discovery_repo.get_service_by_id("new-svc") is not None
+
+    async def test_bulk_register_replaces_heartbeats(
+        self, service_discovery_repo, make_service, now
+    ):
+        """GIVEN a registered service with a fresh heartbeat
+        WHEN bulk registering it again with an old heartbeat alongside a new service
+        THEN the stale sweep uses the re-registered heartbeat."""
+        # Given
+        old_time = now - timedelta(seconds=120)
+        await service_discovery_repo.register(make_service("svc-0"))
+
+        # When
+        await service_discovery_repo.bulk_register(
+            [
+                make_service("svc-0", last_seen=old_time, registered_at=old_time),
+                make_service("svc-1", grpc_port=50052, http_port=8081),
+            ]
+        )
+        removed = await service_discovery_repo.remove_stale_services(threshold_seconds=60)
+
+        # Then
+        assert removed == 1
+        assert await service_discovery_repo.get_service_by_id("svc-0") is None
+        remaining = await service_discovery_repo.list_services_by_name("trading-engine")
+        assert [s.service_id for s in remaining] == ["svc-1"]
+
+    async def test_heartbeat_keeps_service_registered(
+        self, service_discovery_repo, make_service, now
+    ):
+        """GIVEN a service registered with an old heartbeat
+        WHEN it sends a fresh heartbeat before the stale sweep
+        THEN the sweep keeps it."""
+        # Given
+        old_time = now - timedelta(seconds=120)
+        await service_discovery_repo.register(
+            make_service("svc-001", last_seen=old_time, registered_at=old_time)
+        )
+        for _ in range(50):
+            await service_discovery_repo.update_heartbeat("svc-001")
+
+        # When
+        removed = await service_discovery_repo.remove_stale_services(threshold_seconds=60)
+
+        # Then
+        assert removed == 0
+        assert await service_discovery_repo.is_service_healthy("svc-001", threshold_seconds=60)
 
 
-@pytest.mark.asyncio
 class TestStubCacheRepository:
     """Test stub cache repository."""
 
-    async def test_set_and_get(self):
+    @pytest.mark.parametrize("filtered, expected_events", [(False, ["cache_set"]), (True, [])])
+    async def test_debug_logging_follows_configured_level(
+        self, monkeypatch, filtered, expected_events
+    ):
+        """GIVEN the repository logger at its default level or filtering below INFO
+        WHEN setting a key
+        THEN the cache_set debug event is emitted only when debug is enabled."""
+        # Given
+        if filtered:
+            monkeypatch.setattr(stub_cache, "logger", _info_level_logger())
+        with capture_logs() as logs:
+            repo = StubCacheRepository()
+
+            # When
+            await repo.set("key1", "value1")
+
+        # Then
+        assert [e["event"] for e in logs if e["log_level"] == "debug"] == expected_events
+        assert await repo.get("key1") == "value1"
+
+    async def test_set_and_get(self, cache_repo):
         """GIVEN a cache repository
         WHEN setting and getting values
         THEN values are stored correctly."""
-        # Given
-        repo = StubCacheRepository()
-
         # When
-        await repo.set("key1", "value1")
-        value = await repo.get("key1")
+        await cache_repo.set("key1", "value1")
+        value = await cache_repo.get("key1")
 
         # Then
         assert value == "value1"
@@ -403,16 +1048,15 @@ class TestStubCacheRepository:
         WHEN TTL expires
         THEN value is no longer available."""
         # Given
-        repo = StubCacheRepository()
+        clock = [0.0]
+        repo = StubCacheRepository(time_func=lambda: clock[0])
         await repo.set("temp-key", "temp-value", ttl=1)
 
         # When - immediately check (should exist)
         value_before = await repo.get("temp-key")
 
-        # Wait for expiration
-        import asyncio
-
-        await asyncio.sleep(1.1)
+        # Advance past expiration
+        clock[0] += 1.2
 
         value_after = await repo.get("temp-key")
 
@@ -420,55 +1064,174 @@ class TestStubCacheRepository:
         assert value_before == "temp-value"
         assert value_after is None
 
-    async def test_increment_decrement(self):
+    async def test_increment_decrement(self, cache_repo):
         """GIVEN numeric cache values
         WHEN incrementing and decrementing
         THEN values change correctly."""
-        # Given
-        repo = StubCacheRepository()
-
         # When
-        val1 = await repo.increment("counter")
-        val2 = await repo.increment("counter", amount=5)
-        val3 = await repo.decrement("counter", amount=2)
+        val1 = await cache_repo.increment("counter")
+        val2 = await cache_repo.increment("counter", amount=5)
+        val3 = await cache_repo.decrement("counter", amount=2)
 
         # Then
         assert val1 == 1
         assert val2 == 6
         assert val3 == 4
 
-    async def test_pattern_operations(self):
+    async def test_increment_after_expiry_starts_new_counter(self):
+        """GIVEN a counter whose TTL has passed
+        WHEN incrementing it
+        THEN the expired value is discarded and counting restarts."""
+        # Given
+        clock = [0.0]
+        repo = StubCacheRepository(time_func=lambda: clock[0])
+        await repo.set("counter", 10, ttl=60)
+        clock[0] += 61
+
+        # When
+        value = await repo.increment("counter")
+
+        # Then
+        assert value == 1
+        assert await repo.get_ttl("counter") is None
+
+    async def test_released_entries_are_reused_without_stale_state(self, cache_repo):
+        """GIVEN a deleted key that had a TTL
+        WHEN a new key is set without TTL
+        THEN the new key does not inherit the old value or expiry."""
+        # Given
+        await cache_repo.set("old", "old-value", ttl=60)
+        await cache_repo.delete("old")
+        await cache_repo.flush_all()
+
+        # When
+        await cache_repo.set("new", "new-value")
+
+        # Then
+        assert await cache_repo.get("new") == "new-value"
+        assert await cache_repo.get_ttl("new") is None
+        assert await cache_repo.get("old") is None
+
+    async def test_evicts_least_recently_used_beyond_max_size(self):
+        """GIVEN a full cache whose oldest key was just read
+        WHEN setting further keys
+        THEN the least recently used keys are evicted first."""
+        # Given
+        repo = StubCacheRepository(max_size=2)
+        await repo.set("a", 1)
+        await repo.set("b", 2)
+        await repo.get("a")
+
+        # When
+        await repo.set("c", 3)
+        await repo.set_many({"d": 4, "e": 5})
+
+        # Then
+        assert await repo.get("b") is None
+        assert await repo.get("a") is None
+        assert await repo.get_many(["c", "d", "e"]) == {"d": 4, "e": 5}
+
+    async def test_pattern_operations(self, cache_repo):
         """GIVEN keys with patterns
         WHEN searching by pattern
         THEN matching keys are found."""
         # Given
-        repo = StubCacheRepository()
-        await repo.set("test:user:1", "user1")
-        await repo.set("test:user:2", "user2")
-        await repo.set("test:session:1", "session1")
+        await cache_repo.set_many(
+            {"test:user:1": "user1", "test:user:2": "user2", "test:session:1": "session1"}
+        )
 
         # When
-        user_keys = await repo.keys("test:user:*")
-        deleted = await repo.delete_pattern("test:user:*")
+        user_keys = await cache_repo.keys("test:user:*")
+        deleted = await cache_repo.delete_pattern("test:user:*")
 
         # Then
         assert len(user_keys) == 2
         assert deleted == 2
-        assert await repo.exists("test:session:1")
-        assert not await repo.exists("test:user:1")
+        assert await cache_repo.exists("test:session:1")
+        assert not await cache_repo.exists("test:user:1")
+
+    async def test_pattern_compiled_once(self, cache_repo):
+        """GIVEN a glob pattern used by keys and then delete_pattern
+        WHEN both run
+        THEN the pattern is compiled once and Redis glob wildcards match."""
+        # Given
+        await cache_repo.set_many({"run:1:a": 1, "run:2:a": 2, "run:10:a": 10})
+        _glob_to_regex.cache_clear()
+
+        # When
+        matched = await cache_repo.keys("run:?:[a-c]")
+        deleted = await cache_repo.delete_pattern("run:?:[a-c]")
+
+        # Then
+        assert matched == ["run:1:a", "run:2:a"]
+        assert deleted == 2
+        info = _glob_to_regex.cache_info()
+        assert (info.misses, info.hits) == (1, 1)
+
+    @pytest.mark.parametrize(
+        "pattern, expected",
+        [
+            ("h[^e]llo", ["hallo"]),
+            ("h[a-b]llo", ["hallo"]),
+            ("h[b-a]llo", ["hallo"]),
+            (r"a\*b", ["a*b"]),
+            (r"a[\]]b", ["a]b"]),
+        ],
+    )
+    async def test_pattern_follows_redis_glob_rules(self, cache_repo, pattern, expected):
+        """GIVEN keys differing in one character
+        WHEN searching with negated classes, ranges or escapes
+        THEN matches follow Redis KEYS semantics."""
+        # Given
+        await cache_repo.set_many({"hello": 1, "hallo": 2, "a*b": 3, "axb": 4, "a]b": 5})
+
+        # When
+        matching = await cache_repo.keys(pattern)
+
+        # Then
+        assert matching == expected
 
-    async def test_json_operations(self):
+    async def test_json_operations(self, cache_repo):
         """GIVEN JSON data
         WHEN storing and retrieving
         THEN JSON is preserved."""
         # Given
-        repo = StubCacheRepository()
         data = {"name": "test", "count": 42, "active": True}
 
         # When
-        await repo.set_json("config", data)
-        retrieved = await repo.get_json("config")
+        await cache_repo.set_json("config", data)
+        retrieved = await cache_repo.get_json("config")
 
         # Then
         assert retrieved == data
         assert retrieved["count"] == 42
+
+    async def test_get_json_parses_encoded_values(self, cache_repo):
+        """GIVEN JSON stored as bytes, as a string, and as invalid text
+        WHEN reading it back with get_json
+        THEN encoded JSON is parsed whatever its type and invalid text yields None."""
+        # Given
+        await cache_repo.set("as-bytes", b'{"count": 1}')
+        await cache_repo.set("as-str", '{"count": 2}')
+        await cache_repo.set("as-list", "[1, 2]")
+        await cache_repo.set("invalid", "{not json")
+
+        # When / Then
+        assert await cache_repo.get_json("as-bytes") == {"count": 1}
+        assert await cache_repo.get_json("as-str") == {"count": 2}
+        assert await cache_repo.get_json("as-list") == [1, 2]
+        assert await cache_repo.get_json("invalid") is None
+
+    async def test_pattern_treats_regex_metacharacters_literally(self, cache_repo):
+        """GIVEN keys containing regex metacharacters
+        WHEN searching by a glob pattern
+        THEN they match literally and only glob syntax is interpreted."""
+        # Given
+        await cache_repo.set("a.b:1", "dotted")
+        await cache_repo.set("axb:1", "not-dotted")
+
+        # When
+        matching = await cache_repo.keys("a.b:*")
+
+        # Then
+        assert matching == ["a.b:1"]